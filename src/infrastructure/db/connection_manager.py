@@ -2,14 +2,67 @@
 
 from __future__ import annotations
 
+import asyncio
+import os
+import re
+import time
+from collections import defaultdict
+from contextlib import asynccontextmanager
 from enum import Enum
-from typing import Any, Dict, Optional
+from functools import lru_cache
+from typing import Any, AsyncIterator, Awaitable, Callable, DefaultDict, Dict, List, Optional, Sequence
 
 from sqlalchemy import text
-from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
-from sqlalchemy.pool import NullPool
+from sqlalchemy.engine import CursorResult, RowMapping, make_url
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine, create_async_engine
+from sqlalchemy.pool import Pool
 
 from src.utils.env_loader import get_db_credentials
+from src.utils.env_settings import env_bool, env_int
+
+
+# 연결 풀 기본값 (환경 변수로 재정의 가능)
+DEFAULT_POOL_SIZE = env_int("DB_POOL_SIZE", (os.cpu_count() or 1) * 2 + 1)
+DEFAULT_MAX_OVERFLOW = env_int("DB_MAX_OVERFLOW", 5)
+DEFAULT_POOL_RECYCLE = env_int("DB_POOL_RECYCLE", 60)
+DEFAULT_POOL_PRE_PING = env_bool("DB_POOL_PRE_PING", False)
+
+# 읽기 전용 모드에서 차단할 DDL/DML 키워드 (단어 경계 기준)
+_WRITE_RE = re.compile(r"\b(?:INSERT|UPDATE|DELETE|DROP|CREATE|ALTER|TRUNCATE)\b", re.IGNORECASE)
+_SELECT_RE = re.compile(r"^\s*SELECT\b", re.IGNORECASE)
+_LIMIT_RE = re.compile(r"\bLIMIT\b", re.IGNORECASE)
+# 시크릿 교체 등으로 자격 증명이 무효해졌음을 나타내는 드라이버 오류 메시지
+_AUTH_ERROR_RE = re.compile(
+    r"password authentication failed|access denied for user|authentication failed|invalid password",
+    re.IGNORECASE
+)
+
+# 자격 증명 캐시 (Secrets Manager 등 원격 조회 반복 방지)
+CREDENTIALS_TTL = env_int("DB_CREDENTIALS_TTL", 300)
+CREDENTIALS_REFRESH_MARGIN = 30
+_CREDENTIALS_CACHE: Dict[tuple, tuple[float, Dict[str, str]]] = {}
+
+
+def _get_cached_credentials(key: tuple, ttl: int = CREDENTIALS_TTL) -> Dict[str, str]:
+    """캐시된 자격 증명을 반환하고, 없거나 만료 임박 시 다시 조회합니다."""
+    now = time.monotonic()
+    cached = _CREDENTIALS_CACHE.get(key)
+    if cached is not None and cached[0] > now:
+        return cached[1]
+    
+    db_name, use_dotenv, use_aws_secrets, aws_secret_name, use_github_secrets, github_secret_name, github_repo = key
+    credentials = get_db_credentials(
+        db_name=db_name,
+        use_dotenv=use_dotenv,
+        use_aws_secrets=use_aws_secrets,
+        aws_secret_name=aws_secret_name,
+        use_github_secrets=use_github_secrets,
+        github_secret_name=github_secret_name,
+        github_repo=github_repo
+    )
+    # 만료 30초 전에 갱신되도록 유효 시간을 앞당김
+    _CREDENTIALS_CACHE[key] = (now + max(ttl - CREDENTIALS_REFRESH_MARGIN, 0), credentials)
+    return credentials
 
 
 class DatabaseType(str, Enum):
@@ -28,9 +81,70 @@ class ConnectionMode(str, Enum):
     READ_WRITE = "read_write"
 
 
+@lru_cache(maxsize=32)
+def _parse_dialect(connection_string: str) -> Optional[DatabaseType]:
+    """연결 문자열에서 DB 타입을 판별합니다 (URL별로 한 번만 파싱)."""
+    try:
+        return DatabaseType(make_url(connection_string).get_backend_name())
+    except Exception:
+        return None
+
+
+DescribeHandler = Callable[[AsyncConnection, Optional[str]], Awaitable[List[Dict[str, Any]]]]
+
+# 프로세스 전역 엔진 캐시: 같은 DB를 가리키는 매니저들이 하나의 풀을 공유
+EngineKey = tuple[str, ConnectionMode, Optional[type[Pool]]]
+_ENGINE_CACHE: Dict[EngineKey, AsyncEngine] = {}
+# 엔진별 참조 수 (엔진을 유지 중인 매니저 + 실행 중인 호출), 0이 되면 풀을 dispose
+_ENGINE_REFCOUNTS: Dict[EngineKey, int] = {}
+_ENGINE_LOCK = asyncio.Lock()
+
+
+async def _acquire_engine(key: EngineKey, create: Callable[[], AsyncEngine], count: int = 1) -> AsyncEngine:
+    """캐시된 엔진(없으면 새로 생성)의 참조를 count개 잡습니다."""
+    async with _ENGINE_LOCK:
+        engine = _ENGINE_CACHE.get(key)
+        if engine is None:
+            engine = _ENGINE_CACHE[key] = create()
+        _ENGINE_REFCOUNTS[key] = _ENGINE_REFCOUNTS.get(key, 0) + count
+        return engine
+
+
+async def _release_engine(key: EngineKey, engine: AsyncEngine) -> None:
+    """엔진 참조를 반납하고, 마지막 참조였으면 캐시에서 빼고 풀을 닫습니다."""
+    async with _ENGINE_LOCK:
+        # close_all_engines()가 이미 정리한 엔진이면 새로 만들어진 같은 키의 참조 수를 건드리지 않음
+        if _ENGINE_CACHE.get(key) is not engine:
+            return
+        remaining = _ENGINE_REFCOUNTS.get(key, 1) - 1
+        if remaining > 0:
+            _ENGINE_REFCOUNTS[key] = remaining
+            return
+        _ENGINE_REFCOUNTS.pop(key, None)
+        del _ENGINE_CACHE[key]
+    await engine.dispose()
+
+
+async def close_all_engines() -> None:
+    """캐시된 모든 엔진을 종료합니다 (프로세스 종료 시 남은 풀을 정리하는 안전장치)."""
+    async with _ENGINE_LOCK:
+        engines = list(_ENGINE_CACHE.values())
+        _ENGINE_CACHE.clear()
+        _ENGINE_REFCOUNTS.clear()
+    for engine in engines:
+        await engine.dispose()
+
+
 class DatabaseConnectionManager:
     """다양한 DB에 대한 연결을 관리합니다."""
     
+    # DB 타입별 describe_tables 구현 (인스턴스 생성 시 한 번만 해석)
+    _DESCRIBE_HANDLERS: Dict[DatabaseType, str] = {
+        DatabaseType.POSTGRESQL: "_describe_postgresql",
+        DatabaseType.MYSQL: "_describe_mysql",
+        DatabaseType.SQLITE: "_describe_sqlite"
+    }
+    
     def __init__(
         self,
         db_name: Optional[str] = None,
@@ -41,12 +155,25 @@ class DatabaseConnectionManager:
         aws_secret_name: Optional[str] = None,
         use_github_secrets: bool = False,
         github_secret_name: Optional[str] = None,
-        github_repo: Optional[str] = None
+        github_repo: Optional[str] = None,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        max_overflow: int = DEFAULT_MAX_OVERFLOW,
+        pool_recycle: int = DEFAULT_POOL_RECYCLE,
+        pool_pre_ping: bool = DEFAULT_POOL_PRE_PING,
+        poolclass: Optional[type[Pool]] = None
     ):
         self.db_name = db_name
         self.mode = mode
+        self.pool_size = pool_size
+        self.max_overflow = max_overflow
+        self.pool_recycle = pool_recycle
+        self.pool_pre_ping = pool_pre_ping
+        # NullPool 등은 단발성 CLI 실행에서만 명시적으로 지정
+        self.poolclass = poolclass
+        # 호출 사이에도 풀을 유지하도록 매니저가 잡고 있는 엔진 참조 (close()에서 반납)
         self._engine: Optional[AsyncEngine] = None
-        self._connection_string = connection_string or self._build_connection_string(
+        self._closed = False
+        credentials_key = (
             db_name,
             use_dotenv,
             use_aws_secrets,
@@ -55,27 +182,29 @@ class DatabaseConnectionManager:
             github_secret_name,
             github_repo
         )
+        # 시크릿에서 만든 연결 문자열일 때만 자격 증명 캐시 키를 보관
+        self._credentials_key: Optional[tuple] = None if connection_string else credentials_key
+        self._connection_string = connection_string or self._build_connection_string(credentials_key)
+        self._dialect = _parse_dialect(self._connection_string)
+        handler_name = self._DESCRIBE_HANDLERS.get(self._dialect) if self._dialect else None
+        self._describe: Optional[DescribeHandler] = getattr(self, handler_name) if handler_name else None
     
-    def _build_connection_string(
-        self,
-        db_name: Optional[str],
-        use_dotenv: bool,
-        use_aws_secrets: bool,
-        aws_secret_name: Optional[str],
-        use_github_secrets: bool,
-        github_secret_name: Optional[str],
-        github_repo: Optional[str]
-    ) -> str:
+    @classmethod
+    def clear_credential_cache(cls) -> None:
+        """캐시된 자격 증명을 모두 비웁니다."""
+        _CREDENTIALS_CACHE.clear()
+    
+    def invalidate_credentials_on_auth_error(self, error: BaseException | str) -> bool:
+        """인증 실패 오류면 이 연결의 캐시된 자격 증명을 버려 다음 호출에서 다시 조회하게 합니다."""
+        if self._credentials_key is None or not _AUTH_ERROR_RE.search(str(error)):
+            return False
+        _CREDENTIALS_CACHE.pop(self._credentials_key, None)
+        return True
+    
+    def _build_connection_string(self, credentials_key: tuple) -> str:
         """환경 변수와 시크릿에서 연결 문자열을 구성합니다."""
-        credentials = get_db_credentials(
-            db_name=db_name,
-            use_dotenv=use_dotenv,
-            use_aws_secrets=use_aws_secrets,
-            aws_secret_name=aws_secret_name,
-            use_github_secrets=use_github_secrets,
-            github_secret_name=github_secret_name,
-            github_repo=github_repo
-        )
+        credentials = _get_cached_credentials(credentials_key)
+        db_name = credentials_key[0]
         
         # DATABASE_URL이 있으면 우선 사용
         if "DATABASE_URL" in credentials:
@@ -100,14 +229,59 @@ class DatabaseConnectionManager:
             raise ValueError(f"Unsupported database type: {db_type}")
     
     async def get_engine(self) -> AsyncEngine:
-        """비동기 엔진을 반환합니다 (연결 풀 사용)."""
+        """비동기 엔진을 반환합니다 (연결 풀 사용, 참조는 close()에서 반납)."""
         if self._engine is None:
-            self._engine = create_async_engine(
-                self._connection_string,
-                poolclass=NullPool if self.mode == ConnectionMode.READ_ONLY else None,
-                echo=False
-            )
+            engine = await _acquire_engine(self._engine_key(), self._create_engine)
+            if self._engine is None:
+                self._engine = engine
+            else:  # 동시에 다른 호출이 먼저 잡은 경우
+                await _release_engine(self._engine_key(), engine)
         return self._engine
+
+    @asynccontextmanager
+    async def _use_engine(self) -> AsyncIterator[AsyncEngine]:
+        """호출 하나가 끝날 때까지 엔진 참조를 잡아 둡니다.
+
+        매니저가 도중에 닫혀도 실행 중인 호출이 끝난 뒤에야 풀이 dispose됩니다.
+        """
+        key = self._engine_key()
+        hold = self._engine is None and not self._closed
+        # 첫 호출이면 매니저가 유지할 참조까지 한 번에 잡음
+        engine = await _acquire_engine(key, self._create_engine, 2 if hold else 1)
+        if hold:
+            if self._engine is None and not self._closed:
+                self._engine = engine
+            else:
+                await _release_engine(key, engine)
+        try:
+            yield engine
+        finally:
+            await _release_engine(key, engine)
+
+    def _create_engine(self) -> AsyncEngine:
+        return create_async_engine(
+            self._connection_string,
+            echo=False,
+            **self._pool_options()
+        )
+    
+    def _engine_key(self) -> EngineKey:
+        return (self._connection_string, self.mode, self.poolclass)
+
+    def _pool_options(self) -> Dict[str, Any]:
+        """create_async_engine에 전달할 풀 옵션을 구성합니다."""
+        if self.poolclass is not None:
+            return {"poolclass": self.poolclass}
+        options: Dict[str, Any] = {
+            "pool_recycle": self.pool_recycle,
+            "pool_pre_ping": self.pool_pre_ping
+        }
+        # SQLite(:memory: 등)는 크기 제한이 없는 풀을 사용하므로 크기 옵션 제외
+        if self._dialect is not DatabaseType.SQLITE:
+            # poolclass를 생략하면 SQLAlchemy가 AsyncAdaptedQueuePool을 선택
+            options["pool_size"] = self.pool_size
+            options["max_overflow"] = self.max_overflow
+        return options
     
     async def execute_query(
         self,
@@ -116,66 +290,76 @@ class DatabaseConnectionManager:
         limit: int = 100
     ) -> Dict[str, Any]:
         """쿼리를 실행하고 결과를 반환합니다."""
-        engine = await self.get_engine()
-        
         # 읽기 전용 모드에서 DDL/DML 차단
-        if self.mode == ConnectionMode.READ_ONLY:
-            query_upper = query.strip().upper()
-            forbidden_keywords = ["INSERT", "UPDATE", "DELETE", "DROP", "CREATE", "ALTER", "TRUNCATE"]
-            if any(keyword in query_upper for keyword in forbidden_keywords):
-                return {
-                    "success": False,
-                    "error": "Write operations are not allowed in read-only mode",
-                    "rows": []
-                }
+        if self.mode == ConnectionMode.READ_ONLY and _WRITE_RE.search(query):
+            return {
+                "success": False,
+                "error": "Write operations are not allowed in read-only mode",
+                "rows": []
+            }
         
         # LIMIT 추가 (SELECT 쿼리인 경우)
-        if query.strip().upper().startswith("SELECT") and "LIMIT" not in query.upper():
+        is_select = _SELECT_RE.match(query) is not None
+        if is_select and not _LIMIT_RE.search(query):
             query = f"{query.rstrip(';')} LIMIT {limit}"
         
-        try:
-            async with engine.begin() as conn:
-                result = await conn.execute(text(query), parameters or {})
+        async with self._use_engine() as engine:
+            try:
+                # 조회는 트랜잭션 없이 autocommit으로 실행 (BEGIN/COMMIT 왕복 제거)
+                if is_select or self.mode == ConnectionMode.READ_ONLY:
+                    async with engine.connect() as conn:
+                        conn = await conn.execution_options(isolation_level="AUTOCOMMIT")
+                        result = await conn.execute(text(query), parameters or {})
+                        return self._build_query_result(result)
                 
-                if result.returns_rows:
-                    rows = [dict(row._mapping) for row in result.fetchall()]
-                    return {
-                        "success": True,
-                        "rows": rows,
-                        "row_count": len(rows)
-                    }
-                else:
-                    return {
-                        "success": True,
-                        "rows": [],
-                        "row_count": result.rowcount if hasattr(result, "rowcount") else 0
-                    }
-        except Exception as e:
+                # 쓰기 작업은 트랜잭션으로 실행
+                async with engine.begin() as conn:
+                    result = await conn.execute(text(query), parameters or {})
+                    return self._build_query_result(result)
+            except Exception as e:
+                return {
+                    "success": False,
+                    "error": str(e),
+                    "rows": []
+                }
+    
+    @staticmethod
+    def _build_query_result(result: CursorResult[Any]) -> Dict[str, Any]:
+        """실행 결과를 MCP 응답 형식으로 변환합니다."""
+        if result.returns_rows:
+            # 컬럼 키 튜플을 한 번만 구해 행마다 재사용
+            keys = tuple(result.keys())
+            rows = [dict(zip(keys, row)) for row in result.fetchall()]
             return {
-                "success": False,
-                "error": str(e),
-                "rows": []
+                "success": True,
+                "rows": rows,
+                "row_count": len(rows)
             }
+        return {
+            "success": True,
+            "rows": [],
+            "row_count": result.rowcount if hasattr(result, "rowcount") else 0
+        }
     
     async def list_databases(self) -> Dict[str, Any]:
         """데이터베이스 목록을 조회합니다."""
         try:
             # PostgreSQL
-            if "postgresql" in self._connection_string:
+            if self._dialect is DatabaseType.POSTGRESQL:
                 result = await self.execute_query("SELECT datname FROM pg_database WHERE datistemplate = false")
                 return {
                     "success": True,
                     "databases": [row["datname"] for row in result.get("rows", [])]
                 }
             # MySQL
-            elif "mysql" in self._connection_string:
+            elif self._dialect is DatabaseType.MYSQL:
                 result = await self.execute_query("SHOW DATABASES")
                 return {
                     "success": True,
                     "databases": [row["Database"] for row in result.get("rows", [])]
                 }
             # SQLite
-            elif "sqlite" in self._connection_string:
+            elif self._dialect is DatabaseType.SQLITE:
                 return {
                     "success": True,
                     "databases": ["main"]
@@ -196,79 +380,16 @@ class DatabaseConnectionManager:
     async def describe_tables(self, database: Optional[str] = None) -> Dict[str, Any]:
         """테이블 목록과 스키마를 조회합니다."""
         try:
-            engine = await self.get_engine()
-            
-            # DB 타입에 따라 적절한 쿼리 사용
-            if "postgresql" in self._connection_string:
-                tables_query = """
-                    SELECT table_name 
-                    FROM information_schema.tables 
-                    WHERE table_schema = COALESCE(:schema, 'public')
-                    AND table_type = 'BASE TABLE'
-                """
-                columns_query = """
-                    SELECT column_name, data_type, is_nullable
-                    FROM information_schema.columns
-                    WHERE table_schema = COALESCE(:schema, 'public') AND table_name = :table_name
-                    ORDER BY ordinal_position
-                """
-            elif "mysql" in self._connection_string:
-                db_name = database or "information_schema"
-                tables_query = f"SHOW TABLES FROM {db_name}"
-                columns_query = f"SHOW COLUMNS FROM {{table_name}} FROM {db_name}"
-            elif "sqlite" in self._connection_string:
-                tables_query = "SELECT name FROM sqlite_master WHERE type='table'"
-                columns_query = "PRAGMA table_info({table_name})"
-            else:
+            if self._describe is None:
                 return {
                     "success": False,
                     "error": "Database type not supported for describing tables",
                     "tables": []
                 }
             
-            # 테이블 목록 조회
-            tables_result = await self.execute_query(tables_query, {"schema": database} if database else {})
-            if not tables_result.get("success"):
-                return tables_result
-            
-            table_names = []
-            if "postgresql" in self._connection_string:
-                table_names = [row["table_name"] for row in tables_result.get("rows", [])]
-            elif "mysql" in self._connection_string:
-                table_names = [list(row.values())[0] for row in tables_result.get("rows", [])]
-            elif "sqlite" in self._connection_string:
-                table_names = [row["name"] for row in tables_result.get("rows", [])]
-            
-            table_info = []
-            for table_name in table_names:
-                if "sqlite" in self._connection_string:
-                    cols_result = await self.execute_query(columns_query.format(table_name=table_name))
-                else:
-                    cols_result = await self.execute_query(columns_query, {"table_name": table_name, "schema": database} if database else {"table_name": table_name})
-                
-                if cols_result.get("success"):
-                    columns = []
-                    for col in cols_result.get("rows", []):
-                        if "sqlite" in self._connection_string:
-                            columns.append({
-                                "name": col["name"],
-                                "type": col["type"],
-                                "nullable": col.get("notnull", 1) == 0
-                            })
-                        else:
-                            col_name = col.get("column_name") or list(col.values())[0]
-                            col_type = col.get("data_type") or col.get("Type", "unknown")
-                            nullable = col.get("is_nullable") == "YES" if "postgresql" in self._connection_string else col.get("Null") == "YES"
-                            columns.append({
-                                "name": col_name,
-                                "type": col_type,
-                                "nullable": nullable
-                            })
-                    
-                    table_info.append({
-                        "name": table_name,
-                        "columns": columns
-                    })
+            # 하나의 연결에서 테이블/컬럼 정보를 모두 조회
+            async with self._use_engine() as engine, engine.connect() as conn:
+                table_info = await self._describe(conn, database)
             
             return {
                 "success": True,
@@ -281,9 +402,92 @@ class DatabaseConnectionManager:
                 "tables": []
             }
     
+    async def _describe_postgresql(self, conn: AsyncConnection, database: Optional[str]) -> List[Dict[str, Any]]:
+        params = {"schema": database}
+        table_rows = await self._fetch_rows(conn, """
+            SELECT table_name
+            FROM information_schema.tables
+            WHERE table_schema = COALESCE(:schema, 'public')
+            AND table_type = 'BASE TABLE'
+        """, params)
+        column_rows = await self._fetch_rows(conn, """
+            SELECT table_name, column_name, data_type, (is_nullable = 'YES') AS nullable
+            FROM information_schema.columns
+            WHERE table_schema = COALESCE(:schema, 'public')
+            ORDER BY table_name, ordinal_position
+        """, params)
+        return self._group_columns([row["table_name"] for row in table_rows], column_rows)
+    
+    async def _describe_mysql(self, conn: AsyncConnection, database: Optional[str]) -> List[Dict[str, Any]]:
+        params = {"schema": database or "information_schema"}
+        table_rows = await self._fetch_rows(conn, """
+            SELECT table_name AS table_name
+            FROM information_schema.tables
+            WHERE table_schema = :schema
+        """, params)
+        column_rows = await self._fetch_rows(conn, """
+            SELECT table_name AS table_name, column_name AS column_name,
+                   column_type AS data_type, (is_nullable = 'YES') AS nullable
+            FROM information_schema.columns
+            WHERE table_schema = :schema
+            ORDER BY table_name, ordinal_position
+        """, params)
+        return self._group_columns([row["table_name"] for row in table_rows], column_rows)
+    
+    async def _describe_sqlite(self, conn: AsyncConnection, database: Optional[str]) -> List[Dict[str, Any]]:
+        table_rows = await self._fetch_rows(conn, "SELECT name FROM sqlite_master WHERE type='table'")
+        table_info = []
+        # PRAGMA는 테이블별로 실행하되 같은 연결을 재사용
+        for row in table_rows:
+            table_name = row["name"]
+            quoted = table_name.replace('"', '""')
+            cols = await self._fetch_rows(conn, f'PRAGMA table_info("{quoted}")')
+            table_info.append({
+                "name": table_name,
+                "columns": [
+                    {
+                        "name": col["name"],
+                        "type": col["type"],
+                        "nullable": col.get("notnull", 1) == 0
+                    }
+                    for col in cols
+                ]
+            })
+        return table_info
+    
+    @staticmethod
+    async def _fetch_rows(
+        conn: AsyncConnection,
+        query: str,
+        parameters: Optional[Dict[str, Any]] = None
+    ) -> Sequence[RowMapping]:
+        # 내부 전용 조회이므로 dict 복사 없이 읽기 전용 매핑을 그대로 사용
+        result = await conn.execute(text(query), parameters or {})
+        return result.mappings().all()
+    
+    @staticmethod
+    def _group_columns(table_names: List[str], column_rows: Sequence[RowMapping]) -> List[Dict[str, Any]]:
+        """information_schema.columns 결과를 테이블별로 묶습니다."""
+        columns_by_table: DefaultDict[str, List[Dict[str, Any]]] = defaultdict(list)
+        for col in column_rows:
+            columns_by_table[col["table_name"]].append({
+                "name": col["column_name"],
+                "type": col["data_type"],
+                # MySQL은 0/1을 반환하므로 bool로 정규화
+                "nullable": bool(col["nullable"])
+            })
+        # 컬럼이 없는 테이블도 포함
+        return [
+            {"name": table_name, "columns": columns_by_table.get(table_name, [])}
+            for table_name in table_names
+        ]
+    
     async def close(self) -> None:
-        """연결을 종료합니다."""
-        if self._engine:
-            await self._engine.dispose()
-            self._engine = None
+        """매니저가 유지하던 엔진 참조를 반납합니다.
 
+        같은 엔진을 쓰는 다른 매니저나 실행 중인 호출이 없으면 풀을 바로 dispose합니다.
+        """
+        self._closed = True
+        engine, self._engine = self._engine, None
+        if engine is not None:
+            await _release_engine(self._engine_key(), engine)
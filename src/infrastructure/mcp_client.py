@@ -5,11 +5,19 @@ from __future__ import annotations
 import asyncio
 import json
 import os
+import time
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional, Sequence
+from typing import Any, Awaitable, Dict, List, Optional, Sequence
 
 import aiohttp
 
+from src.utils import json_utils
+
+# 프록시 fan-out 시 동시 실행 상한
+MAX_CONCURRENT_PROXY_CALLS = 32
+# 전체 프록시 종료에 허용하는 최대 시간 (초)
+DISCONNECT_ALL_TIMEOUT = 10.0
+
 
 @dataclass
 class MCPProxyConfig:
@@ -21,45 +29,74 @@ class MCPProxyConfig:
     env: Optional[Dict[str, str]] = None
     cwd: Optional[str] = None
     namespace_prefix: str = ""  # 도구 이름 충돌 방지용 접두사
+    tools_ttl: float = 30.0  # tools/list 결과 캐시 유지 시간 (초)
+    tool_timeout: float = 60.0  # 도구 호출 1회당 제한 시간 (초)
 
 
 class MCPProxyClient:
     """외부 MCP 서버를 프록시하는 클라이언트."""
     
-    def __init__(self, config: MCPProxyConfig) -> None:
+    def __init__(self, config: MCPProxyConfig, session: Optional[aiohttp.ClientSession] = None) -> None:
         self.config = config
         self._process: Optional[asyncio.subprocess.Process] = None
-        self._http_session: Optional[aiohttp.ClientSession] = None
+        # 공유 세션이 주어지면 재사용하고, 종료는 소유자(매니저)에게 맡김
+        self._http_session: Optional[aiohttp.ClientSession] = session
+        self._owns_session = session is None
         self._tools_cache: List[Dict[str, Any]] = []
+        self._tools_cache_expiry = 0.0
+        # subprocess 환경 변수는 최초 연결 시 한 번만 구성
+        self._subprocess_env: Optional[Dict[str, str]] = None
         self._connected = False
         self._request_id = 0
+        # stdio 응답 다중화: 요청 ID → 응답 대기 Future
+        self._pending: Dict[int, asyncio.Future[Dict[str, Any]]] = {}
+        self._reader_task: Optional[asyncio.Task[None]] = None
+        self._write_lock = asyncio.Lock()
+        self._connect_lock = asyncio.Lock()
     
     async def connect(self) -> None:
         """MCP 서버에 연결합니다."""
-        if self.config.url:
-            # URL 기반 MCP 서버 (HTTP)
-            self._http_session = aiohttp.ClientSession()
-            self._connected = True
-        elif self.config.command:
-            # stdio 기반 MCP 서버 (subprocess)
-            env = os.environ.copy()
-            if self.config.env:
-                env.update(self.config.env)
-            
-            self._process = await asyncio.create_subprocess_exec(
-                *self.config.command,
-                stdin=asyncio.subprocess.PIPE,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
-                env=env,
-                cwd=self.config.cwd
-            )
-            self._connected = True
-        else:
-            raise ValueError(f"Invalid MCP proxy config for {self.config.name}: need either url or command")
+        # 동시 요청이 각자 프로세스를 띄우지 않도록 연결을 직렬화
+        async with self._connect_lock:
+            if self._connected:
+                return
+            if self.config.url:
+                # URL 기반 MCP 서버 (HTTP)
+                if self._http_session is None or self._http_session.closed:
+                    self._http_session = aiohttp.ClientSession()
+                    self._owns_session = True
+                self._connected = True
+            elif self.config.command:
+                # stdio 기반 MCP 서버 (subprocess)
+                if self._subprocess_env is None:
+                    env = os.environ.copy()
+                    if self.config.env:
+                        env.update(self.config.env)
+                    self._subprocess_env = env
+                
+                self._process = await asyncio.create_subprocess_exec(
+                    *self.config.command,
+                    stdin=asyncio.subprocess.PIPE,
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.PIPE,
+                    env=self._subprocess_env,
+                    cwd=self.config.cwd
+                )
+                self._reader_task = asyncio.create_task(self._reader_loop())
+                self._connected = True
+            else:
+                raise ValueError(f"Invalid MCP proxy config for {self.config.name}: need either url or command")
     
     async def disconnect(self) -> None:
         """연결을 종료합니다."""
+        if self._reader_task:
+            self._reader_task.cancel()
+            try:
+                await self._reader_task
+            except asyncio.CancelledError:
+                pass
+            self._reader_task = None
+        self._fail_pending(ConnectionError(f"MCP proxy {self.config.name} disconnected"))
         if self._process:
             try:
                 self._process.terminate()
@@ -67,11 +104,41 @@ class MCPProxyClient:
             except asyncio.TimeoutError:
                 self._process.kill()
             self._process = None
-        if self._http_session:
+        if self._http_session and self._owns_session:
             await self._http_session.close()
             self._http_session = None
         self._connected = False
     
+    async def _reader_loop(self) -> None:
+        """stdout 응답을 읽어 요청 ID에 해당하는 Future에 전달합니다."""
+        stdout = self._process.stdout if self._process else None
+        if stdout is None:
+            return
+        try:
+            while True:
+                line = await stdout.readline()
+                if not line:
+                    break
+                try:
+                    message = json_utils.loads(line)
+                except json.JSONDecodeError:
+                    continue  # JSON이 아닌 출력(로그 등)은 무시
+                # 알림이나 서버 측 요청은 대기 중인 응답이 아님
+                if not isinstance(message, dict) or "method" in message:
+                    continue
+                future = self._pending.pop(message.get("id"), None)
+                if future is not None and not future.done():
+                    future.set_result(message)
+        finally:
+            self._fail_pending(ConnectionError(f"MCP proxy {self.config.name} closed stdout"))
+    
+    def _fail_pending(self, exc: BaseException) -> None:
+        """응답을 기다리는 모든 요청을 실패 처리합니다."""
+        pending, self._pending = self._pending, {}
+        for future in pending.values():
+            if not future.done():
+                future.set_exception(exc)
+    
     def _get_next_request_id(self) -> int:
         """다음 요청 ID를 반환합니다."""
         self._request_id += 1
@@ -111,26 +178,26 @@ class MCPProxyClient:
             # stdio 기반 MCP 서버
             if not self._process or not self._process.stdin:
                 raise RuntimeError("Process not initialized")
-            
-            request_json = json.dumps(request) + "\n"
-            self._process.stdin.write(request_json.encode('utf-8'))
-            await self._process.stdin.drain()
-            
-            # 응답 읽기 (한 줄씩)
-            if not self._process.stdout:
+            if not self._reader_task or self._reader_task.done():
                 raise RuntimeError("Process stdout not available")
             
-            line = await self._process.stdout.readline()
-            response = json.loads(line.decode('utf-8'))
-            
-            # 요청 ID 확인
-            if response.get("id") != request_id:
-                raise ValueError(f"Request ID mismatch: expected {request_id}, got {response.get('id')}")
-            
-            return response
+            # 응답은 리더 태스크가 ID로 매칭하므로 여러 요청을 동시에 보낼 수 있음
+            future: asyncio.Future[Dict[str, Any]] = asyncio.get_running_loop().create_future()
+            self._pending[request_id] = future
+            try:
+                request_bytes = json_utils.dumps_bytes(request) + b"\n"
+                async with self._write_lock:
+                    self._process.stdin.write(request_bytes)
+                    await self._process.stdin.drain()
+                return await future
+            finally:
+                self._pending.pop(request_id, None)
     
     async def list_tools(self) -> List[Dict[str, Any]]:
         """사용 가능한 도구 목록을 조회합니다."""
+        if self._tools_cache and time.monotonic() < self._tools_cache_expiry:
+            return self._tools_cache
+        
         if not self._connected:
             await self.connect()
         
@@ -138,25 +205,32 @@ class MCPProxyClient:
             response = await self._send_jsonrpc_request("tools/list")
             
             if "error" in response:
-                return []
+                # 일시적 오류 시 이전 캐시를 계속 사용
+                return self._tools_cache
             
             result = response.get("result", {})
             tools = result.get("tools", [])
             
-            # 네임스페이스 접두사 추가
-            prefixed_tools = []
-            for tool in tools:
-                prefixed_name = f"{self.config.namespace_prefix}{tool['name']}" if self.config.namespace_prefix else tool['name']
-                prefixed_tool = tool.copy()
-                prefixed_tool["name"] = prefixed_name
-                prefixed_tool["original_name"] = tool["name"]  # 원본 이름 보존
-                prefixed_tools.append(prefixed_tool)
+            # 네임스페이스 접두사 추가 (원본 이름 보존)
+            prefix = self.config.namespace_prefix
+            if prefix:
+                prefixed_tools = [
+                    {**tool, "name": prefix + tool["name"], "original_name": tool["name"]}
+                    for tool in tools
+                ]
+            else:
+                prefixed_tools = [{**tool, "original_name": tool["name"]} for tool in tools]
             
             self._tools_cache = prefixed_tools
+            self._tools_cache_expiry = time.monotonic() + self.config.tools_ttl
             return prefixed_tools
         except Exception as e:
-            # 오류 발생 시 빈 리스트 반환
-            return []
+            # 오류 발생 시 이전 캐시(없으면 빈 리스트) 반환
+            return self._tools_cache
+    
+    def invalidate_tools_cache(self) -> None:
+        """다음 list_tools 호출 시 도구 목록을 다시 조회하도록 합니다."""
+        self._tools_cache_expiry = 0.0
     
     async def call_tool(self, tool_name: str, arguments: Dict[str, Any]) -> Dict[str, Any]:
         """도구를 호출합니다."""
@@ -164,9 +238,8 @@ class MCPProxyClient:
             await self.connect()
         
         # 네임스페이스 접두사 제거하여 원본 이름 찾기
-        original_name = tool_name
-        if self.config.namespace_prefix and tool_name.startswith(self.config.namespace_prefix):
-            original_name = tool_name[len(self.config.namespace_prefix):]
+        prefix = self.config.namespace_prefix
+        original_name = tool_name.removeprefix(prefix) if prefix else tool_name
         
         try:
             response = await self._send_jsonrpc_request(
@@ -191,27 +264,56 @@ class MCPProxyManager:
     
     def __init__(self) -> None:
         self._proxies: Dict[str, MCPProxyClient] = {}
+        self._session: Optional[aiohttp.ClientSession] = None
+    
+    def _get_shared_session(self) -> aiohttp.ClientSession:
+        """HTTP 프록시들이 함께 사용하는 세션을 반환합니다 (keep-alive 연결 재사용)."""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=100,
+                    limit_per_host=20,
+                    keepalive_timeout=60,
+                    ttl_dns_cache=300
+                )
+            )
+        return self._session
     
     def register_proxy(self, config: MCPProxyConfig) -> None:
         """프록시 클라이언트를 등록합니다."""
-        proxy = MCPProxyClient(config)
+        session = self._get_shared_session() if config.url else None
+        proxy = MCPProxyClient(config, session=session)
         self._proxies[config.name] = proxy
     
+    def prefix_map(self) -> Dict[str, str]:
+        """도구 이름 접두사(끝의 "_" 제외) → 프록시 이름 매핑을 반환합니다."""
+        mapping: Dict[str, str] = {}
+        for name, proxy in self._proxies.items():
+            mapping[name] = name
+            mapping[name.replace("-", "_")] = name
+            prefix = proxy.config.namespace_prefix.rstrip("_")
+            if prefix:
+                mapping[prefix] = name
+        return mapping
+    
     async def get_all_tools(self) -> List[Dict[str, Any]]:
         """모든 프록시 서버의 도구를 조회합니다."""
+        proxies = list(self._proxies.values())
+        # 프록시별 조회를 동시에 실행 (전체 지연 = 가장 느린 프록시)
+        results = await self._gather_bounded([proxy.list_tools() for proxy in proxies])
+        
         all_tools = []
-        for proxy in self._proxies.values():
-            try:
-                tools = await proxy.list_tools()
-                all_tools.extend(tools)
-            except Exception as e:
+        for proxy, result in zip(proxies, results):
+            if isinstance(result, BaseException):
                 # 개별 프록시 실패는 무시하고 계속 진행
                 all_tools.append({
                     "name": f"{proxy.config.namespace_prefix}error",
-                    "description": f"Failed to load tools from {proxy.config.name}: {str(e)}",
+                    "description": f"Failed to load tools from {proxy.config.name}: {str(result)}",
                     "inputSchema": {},
                     "error": True
                 })
+            else:
+                all_tools.extend(result)
         return all_tools
     
     async def call_proxy_tool(self, proxy_name: str, tool_name: str, arguments: Dict[str, Any]) -> Dict[str, Any]:
@@ -220,13 +322,32 @@ class MCPProxyManager:
             raise ValueError(f"Proxy {proxy_name} not found")
         
         proxy = self._proxies[proxy_name]
-        return await proxy.call_tool(tool_name, arguments)
+        try:
+            async with asyncio.timeout(proxy.config.tool_timeout):
+                return await proxy.call_tool(tool_name, arguments)
+        except TimeoutError:
+            return {"error": f"Tool {tool_name} on proxy {proxy_name} timed out after {proxy.config.tool_timeout}s"}
     
     async def disconnect_all(self) -> None:
         """모든 프록시 연결을 종료합니다."""
-        for proxy in self._proxies.values():
-            try:
-                await proxy.disconnect()
-            except Exception:
-                pass
-
+        try:
+            # 응답 없는 프록시가 있어도 전체 종료 시간은 제한
+            async with asyncio.timeout(DISCONNECT_ALL_TIMEOUT):
+                await self._gather_bounded([proxy.disconnect() for proxy in self._proxies.values()])
+        except TimeoutError:
+            pass
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+    
+    async def _gather_bounded(self, coros: List[Awaitable[Any]]) -> List[Any]:
+        """코루틴을 동시에 실행하고, 프록시가 많으면 동시 실행 수를 제한합니다."""
+        if len(coros) > MAX_CONCURRENT_PROXY_CALLS:
+            semaphore = asyncio.Semaphore(MAX_CONCURRENT_PROXY_CALLS)
+            
+            async def _bounded(coro: Awaitable[Any]) -> Any:
+                async with semaphore:
+                    return await coro
+            
+            coros = [_bounded(coro) for coro in coros]
+        return await asyncio.gather(*coros, return_exceptions=True)
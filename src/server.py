@@ -3,258 +3,136 @@
 from __future__ import annotations
 
 import asyncio
-import json
+import sys
 from dataclasses import dataclass
+from functools import partial
 from typing import Any, Awaitable, Callable, Dict, List, Sequence
 
 from mcp.server import Server
 from mcp.server.stdio import stdio_server
 from mcp.types import Tool, TextContent
 
-from src.tools.aws_tool import AWSService
-from src.tools.code_analysis_tool import CodeAnalysisService
-from src.tools.db_tool import DatabaseService
-from src.tools.document_tool import DocumentService
-from src.tools.flyio_tool import FlyioService
-from src.tools.github_tool import GitHubService
+from src.servers.base_server import (
+    ArgExtractor,
+    ToolDefinition,
+    ToolHandler,
+    ToolRegistry,
+    arg_extractor,
+    error_content as _error_content,
+    schema as _schema,
+    to_text_contents as _to_text_contents,
+)
+from src.services import (
+    close_services,
+    get_aws_service,
+    get_code_analysis_service,
+    get_db_service,
+    get_document_service,
+    get_flyio_service,
+    get_github_service,
+    get_official_docs_service,
+    get_pdf_service,
+    run_in_docs_executor,
+)
 from src.tools.mcp_proxy_tool import mcp_proxy_service
-from src.tools.official_docs import OfficialDocsService
-from src.tools.pdf_tool import PDFService
+from src.utils import event_loop
+from src.utils.ttl_cache import TTLCache, cached_call
 
-ToolHandler = Callable[[dict[str, Any]], Awaitable[Any]]
-JSON_INDENT = 2
+# 서비스는 처음 사용될 때 생성 (도구 모듈 import 비용을 서버 시작 시점에서 제외)
+_SERVICE_GETTERS: Dict[str, Callable[[], Any]] = {
+    "document_service": get_document_service,
+    "aws_service": get_aws_service,
+    "flyio_service": get_flyio_service,
+    "pdf_service": get_pdf_service,
+    "code_analysis_service": get_code_analysis_service,
+    "db_service": get_db_service,
+    "official_docs_service": get_official_docs_service,
+    "github_service": get_github_service,
+}
 
 
-@dataclass(frozen=True, slots=True)
-class ToolDefinition:
-    """개별 MCP 도구 정의."""
-
-    name: str
-    description: str
-    schema: Dict[str, Any]
-    handler: ToolHandler
-
-
-class ToolRegistry:
-    """ToolDefinition을 관리하고 MCP Server에 노출합니다."""
-
-    def __init__(self, definitions: Sequence[ToolDefinition]) -> None:
-        self._definitions = {definition.name: definition for definition in definitions}
-
-    def list_tools(self) -> List[Tool]:
-        return [
-            Tool(
-                name=definition.name,
-                description=definition.description,
-                inputSchema=definition.schema
-            )
-            for definition in self._definitions.values()
-        ]
-
-    def get_handler(self, name: str) -> ToolHandler | None:
-        definition = self._definitions.get(name)
-        return definition.handler if definition else None
-
-
-document_service = DocumentService()
-aws_service = AWSService()
-flyio_service = FlyioService()
-pdf_service = PDFService()
-code_analysis_service = CodeAnalysisService()
-db_service = DatabaseService()
-official_docs_service = OfficialDocsService()
-github_service = GitHubService()
-
-
-def _schema(properties: Dict[str, Any], required: Sequence[str] | None = None) -> Dict[str, Any]:
-    return {
-        "type": "object",
-        "properties": properties,
-        "required": list(required or [])
-    }
-
-
-def _require(arguments: dict[str, Any], key: str) -> Any:
-    if key not in arguments:
-        raise ValueError(f"Missing required argument: {key}")
-    return arguments[key]
-
-
-async def _handle_read_document(arguments: dict[str, Any]) -> Any:
-    return await document_service.read_document(_require(arguments, "file_path"))
+def __getattr__(name: str) -> Any:
+    # 기존의 `server.aws_service` 형태 접근 호환 (PEP 562)
+    getter = _SERVICE_GETTERS.get(name)
+    if getter is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getter()
 
 
-async def _handle_list_workspace_projects(_: dict[str, Any]) -> Any:
-    return await document_service.scan_projects()
+def _lazy(getter: Callable[[], Any], method: str) -> Callable[..., Any]:
+    """호출 시점에 서비스를 가져와 메서드를 실행하는 함수를 만듭니다."""
+    def call(*args: Any) -> Any:
+        return getattr(getter(), method)(*args)
 
+    call.__name__ = method
+    return call
 
-async def _handle_search_documents(arguments: dict[str, Any]) -> Any:
-    return await document_service.search_documents(
-        _require(arguments, "query"),
-        arguments.get("project_name")
-    )
+# 선택 인자 목록이 없을 때 매번 새 리스트를 만들지 않도록 공유하는 빈 튜플
+_EMPTY_ARGS: tuple[str, ...] = ()
 
 
-async def _handle_aws_cli_execute(arguments: dict[str, Any]) -> Any:
-    service = _require(arguments, "service")
-    operation = _require(arguments, "operation")
-    additional_args = arguments.get("additional_args") or []
-    return await aws_service.execute(service, operation, additional_args)
-
-
-async def _handle_aws_list_resources(arguments: dict[str, Any]) -> Any:
-    return await aws_service.list_resources(
-        _require(arguments, "service"),
-        arguments.get("resource_type")
-    )
-
-
-async def _handle_aws_get_account_info(_: dict[str, Any]) -> Any:
-    return await aws_service.get_account_info()
-
-
-async def _handle_flyio_list_apps(_: dict[str, Any]) -> Any:
-    return await flyio_service.list_apps()
-
-
-async def _handle_flyio_get_status(arguments: dict[str, Any]) -> Any:
-    return await flyio_service.get_status(_require(arguments, "app_name"))
-
-
-async def _handle_flyio_get_logs(arguments: dict[str, Any]) -> Any:
-    return await flyio_service.get_logs(
-        _require(arguments, "app_name"),
-        arguments.get("lines", 50)
-    )
-
-
-async def _handle_markdown_to_pdf(arguments: dict[str, Any]) -> Any:
-    return await pdf_service.convert(
-        _require(arguments, "markdown_path"),
-        arguments.get("output_path"),
-        arguments.get("css_path")
-    )
-
+@dataclass(frozen=True, slots=True)
+class ArgSpec:
+    """도구 인자를 서비스 메서드의 위치 인자로 매핑하는 선언적 명세."""
 
-async def _handle_analyze_code_flow(arguments: dict[str, Any]) -> Any:
-    return await code_analysis_service.analyze_code_flow(
-        _require(arguments, "project_path"),
-        arguments.get("entry_point")
-    )
+    target: Callable[..., Awaitable[Any]]
+    required: tuple[str, ...] = ()
+    optional: tuple[tuple[str, Any], ...] = ()
 
 
-async def _handle_find_related_code(arguments: dict[str, Any]) -> Any:
-    return await code_analysis_service.find_related_code(
-        _require(arguments, "project_path"),
-        arguments.get("target_function"),
-        arguments.get("target_class"),
-        arguments.get("target_import")
-    )
+async def _dispatch(
+    target: Callable[..., Awaitable[Any]],
+    extract: ArgExtractor,
+    arguments: dict[str, Any]
+) -> Any:
+    return await target(*extract(arguments))
 
 
-async def _handle_code_reusability(arguments: dict[str, Any]) -> Any:
-    return await code_analysis_service.get_code_reusability(
-        _require(arguments, "project_path"),
-        arguments.get("language", "python")
-    )
+def _spec_handler(spec: ArgSpec) -> ToolHandler:
+    return partial(_dispatch, spec.target, arg_extractor(spec.required, dict(spec.optional)))
 
 
-async def _handle_list_databases(arguments: dict[str, Any]) -> Any:
-    return await db_service.list_databases(
-        arguments.get("db_name"),
-        arguments.get("connection_string"),
-        arguments.get("use_dotenv", True),
-        arguments.get("use_aws_secrets", False),
-        arguments.get("aws_secret_name"),
-        arguments.get("use_github_secrets", False),
-        arguments.get("github_secret_name"),
-        arguments.get("github_repo")
-    )
+# 공식 문서 목록/검색 결과 캐시 (동기화 시 비움)
+_DOCS_CACHE = TTLCache(maxsize=256, ttl=60.0)
 
 
-async def _handle_describe_tables(arguments: dict[str, Any]) -> Any:
-    return await db_service.describe_tables(
-        arguments.get("db_name"),
-        arguments.get("connection_string"),
-        arguments.get("database"),
-        arguments.get("use_dotenv", True),
-        arguments.get("use_aws_secrets", False),
-        arguments.get("aws_secret_name"),
-        arguments.get("use_github_secrets", False),
-        arguments.get("github_secret_name"),
-        arguments.get("github_repo")
-    )
+# 캐시 조회는 이벤트 루프에서 처리해 적중 시 스레드 풀을 거치지 않음
+_run_docs_cached = partial(cached_call, _DOCS_CACHE, runner=run_in_docs_executor)
 
 
-async def _handle_run_query(arguments: dict[str, Any]) -> Any:
-    return await db_service.run_query(
-        _require(arguments, "query"),
-        arguments.get("db_name"),
-        arguments.get("connection_string"),
-        arguments.get("parameters"),
-        arguments.get("limit", 100),
-        arguments.get("mode", "read_only"),
-        arguments.get("use_dotenv", True),
-        arguments.get("use_aws_secrets", False),
-        arguments.get("aws_secret_name"),
-        arguments.get("use_github_secrets", False),
-        arguments.get("github_secret_name"),
-        arguments.get("github_repo")
-    )
+async def _sync_official_docs(names: List[str] | None, force: bool) -> Any:
+    try:
+        return await run_in_docs_executor(get_official_docs_service().sync_docs, names, force)
+    finally:
+        _DOCS_CACHE.clear()
 
 
-async def _handle_sync_official_docs(arguments: dict[str, Any]) -> Any:
-    return await asyncio.to_thread(
-        official_docs_service.sync_docs,
-        arguments.get("names"),
-        arguments.get("force", False)
-    )
+# DB 도구 공통 자격 증명 옵션 (서비스 메서드 인자 순서)
+_DB_CREDENTIAL_OPTIONS: tuple[tuple[str, Any], ...] = (
+    ("use_dotenv", True),
+    ("use_aws_secrets", False),
+    ("aws_secret_name", None),
+    ("use_github_secrets", False),
+    ("github_secret_name", None),
+    ("github_repo", None),
+)
 
 
-async def _handle_list_official_docs(_: dict[str, Any]) -> Any:
-    return await asyncio.to_thread(official_docs_service.list_docs)
-
-
-async def _handle_search_official_docs(arguments: dict[str, Any]) -> Any:
-    return await asyncio.to_thread(
-        official_docs_service.search_docs,
-        _require(arguments, "query"),
-        arguments.get("name"),
-        arguments.get("limit", 5)
-    )
+# GitHub 읽기 전용 목록 조회 결과 캐시 (github_cli_execute 실행 시 비움)
+_GITHUB_CACHE = TTLCache(maxsize=256, ttl=60.0)
+_run_github_cached = partial(cached_call, _GITHUB_CACHE)
 
 
 async def _handle_github_cli_execute(arguments: dict[str, Any]) -> Any:
-    command = _require(arguments, "command")
-    args_list = arguments.get("args") or []
-    if not isinstance(args_list, list):
+    command = arguments["command"]
+    args_list = arguments.get("args") or _EMPTY_ARGS
+    if not isinstance(args_list, (list, tuple)):
         raise ValueError("args must be an array of strings")
-    return await github_service.execute([command, *args_list])
-
-
-async def _handle_github_list_repos(arguments: dict[str, Any]) -> Any:
-    return await github_service.list_repos(
-        owner=arguments.get("owner"),
-        visibility=arguments.get("visibility"),
-        limit=arguments.get("limit", 20),
-        sort=arguments.get("sort", "updated")
-    )
-
-
-async def _handle_github_list_prs(arguments: dict[str, Any]) -> Any:
-    return await github_service.list_pull_requests(
-        repo=_require(arguments, "repo"),
-        state=arguments.get("state", "open"),
-        limit=arguments.get("limit", 20)
-    )
-
-
-async def _handle_github_list_issues(arguments: dict[str, Any]) -> Any:
-    return await github_service.list_issues(
-        repo=_require(arguments, "repo"),
-        state=arguments.get("state", "open"),
-        limit=arguments.get("limit", 20)
-    )
+    try:
+        return await get_github_service().execute([command, *args_list])
+    finally:
+        # 임의 명령은 저장소 상태를 바꿀 수 있으므로 목록 캐시를 비움
+        _GITHUB_CACHE.clear()
 
 
 def _build_tool_definitions() -> List[ToolDefinition]:
@@ -271,13 +149,13 @@ def _build_tool_definitions() -> List[ToolDefinition]:
                 },
                 ["file_path"]
             ),
-            handler=_handle_read_document
+            handler=_spec_handler(ArgSpec(_lazy(get_document_service, "read_document"), ("file_path",)))
         ),
         ToolDefinition(
             name="list_workspace_projects",
             description="워크스페이스의 프로젝트 목록을 스캔합니다.",
             schema=_schema({}),
-            handler=_handle_list_workspace_projects
+            handler=_spec_handler(ArgSpec(_lazy(get_document_service, "scan_projects")))
         ),
         ToolDefinition(
             name="search_documents",
@@ -289,7 +167,7 @@ def _build_tool_definitions() -> List[ToolDefinition]:
                 },
                 ["query"]
             ),
-            handler=_handle_search_documents
+            handler=_spec_handler(ArgSpec(_lazy(get_document_service, "search_documents"), ("query",), (("project_name", None),)))
         ),
         ToolDefinition(
             name="aws_cli_execute",
@@ -306,7 +184,7 @@ def _build_tool_definitions() -> List[ToolDefinition]:
                 },
                 ["service", "operation"]
             ),
-            handler=_handle_aws_cli_execute
+            handler=_spec_handler(ArgSpec(_lazy(get_aws_service, "execute"), ("service", "operation"), (("additional_args", _EMPTY_ARGS),)))
         ),
         ToolDefinition(
             name="aws_list_resources",
@@ -318,19 +196,19 @@ def _build_tool_definitions() -> List[ToolDefinition]:
                 },
                 ["service"]
             ),
-            handler=_handle_aws_list_resources
+            handler=_spec_handler(ArgSpec(_lazy(get_aws_service, "list_resources"), ("service",), (("resource_type", None),)))
         ),
         ToolDefinition(
             name="aws_get_account_info",
             description="AWS 계정 정보를 조회합니다.",
             schema=_schema({}),
-            handler=_handle_aws_get_account_info
+            handler=_spec_handler(ArgSpec(_lazy(get_aws_service, "get_account_info")))
         ),
         ToolDefinition(
             name="flyio_list_apps",
             description="Fly.io 앱 목록을 조회합니다.",
             schema=_schema({}),
-            handler=_handle_flyio_list_apps
+            handler=_spec_handler(ArgSpec(_lazy(get_flyio_service, "list_apps")))
         ),
         ToolDefinition(
             name="flyio_get_app_status",
@@ -341,7 +219,7 @@ def _build_tool_definitions() -> List[ToolDefinition]:
                 },
                 ["app_name"]
             ),
-            handler=_handle_flyio_get_status
+            handler=_spec_handler(ArgSpec(_lazy(get_flyio_service, "get_status"), ("app_name",)))
         ),
         ToolDefinition(
             name="flyio_get_app_logs",
@@ -353,7 +231,7 @@ def _build_tool_definitions() -> List[ToolDefinition]:
                 },
                 ["app_name"]
             ),
-            handler=_handle_flyio_get_logs
+            handler=_spec_handler(ArgSpec(_lazy(get_flyio_service, "get_logs"), ("app_name",), (("lines", 50),)))
         ),
         ToolDefinition(
             name="markdown_to_pdf",
@@ -366,7 +244,7 @@ def _build_tool_definitions() -> List[ToolDefinition]:
                 },
                 ["markdown_path"]
             ),
-            handler=_handle_markdown_to_pdf
+            handler=_spec_handler(ArgSpec(_lazy(get_pdf_service, "convert"), ("markdown_path",), (("output_path", None), ("css_path", None))))
         ),
         ToolDefinition(
             name="analyze_code_flow",
@@ -378,7 +256,7 @@ def _build_tool_definitions() -> List[ToolDefinition]:
                 },
                 ["project_path"]
             ),
-            handler=_handle_analyze_code_flow
+            handler=_spec_handler(ArgSpec(_lazy(get_code_analysis_service, "analyze_code_flow"), ("project_path",), (("entry_point", None),)))
         ),
         ToolDefinition(
             name="find_related_code",
@@ -392,7 +270,11 @@ def _build_tool_definitions() -> List[ToolDefinition]:
                 },
                 ["project_path"]
             ),
-            handler=_handle_find_related_code
+            handler=_spec_handler(ArgSpec(
+                _lazy(get_code_analysis_service, "find_related_code"),
+                ("project_path",),
+                (("target_function", None), ("target_class", None), ("target_import", None))
+            ))
         ),
         ToolDefinition(
             name="get_code_reusability",
@@ -404,7 +286,7 @@ def _build_tool_definitions() -> List[ToolDefinition]:
                 },
                 ["project_path"]
             ),
-            handler=_handle_code_reusability
+            handler=_spec_handler(ArgSpec(_lazy(get_code_analysis_service, "get_code_reusability"), ("project_path",), (("language", "python"),)))
         ),
         ToolDefinition(
             name="list_databases",
@@ -422,7 +304,10 @@ def _build_tool_definitions() -> List[ToolDefinition]:
                 },
                 None
             ),
-            handler=_handle_list_databases
+            handler=_spec_handler(ArgSpec(
+                _lazy(get_db_service, "list_databases"),
+                optional=(("db_name", None), ("connection_string", None), *_DB_CREDENTIAL_OPTIONS)
+            ))
         ),
         ToolDefinition(
             name="describe_tables",
@@ -441,7 +326,32 @@ def _build_tool_definitions() -> List[ToolDefinition]:
                 },
                 None
             ),
-            handler=_handle_describe_tables
+            handler=_spec_handler(ArgSpec(
+                _lazy(get_db_service, "describe_tables"),
+                optional=(("db_name", None), ("connection_string", None), ("database", None), *_DB_CREDENTIAL_OPTIONS)
+            ))
+        ),
+        ToolDefinition(
+            name="list_databases_many",
+            description="여러 연결의 데이터베이스 목록을 한 번에 조회합니다 (요청별 병렬 실행, 결과는 요청 순서).",
+            schema=_schema(
+                {
+                    "requests": {"type": "array", "items": {"type": "object"}, "description": "list_databases 인자 객체 목록"}
+                },
+                ["requests"]
+            ),
+            handler=_spec_handler(ArgSpec(_lazy(get_db_service, "list_databases_many"), ("requests",)))
+        ),
+        ToolDefinition(
+            name="describe_many",
+            description="여러 연결/데이터베이스의 테이블 스키마를 한 번에 조회합니다 (요청별 병렬 실행, 결과는 요청 순서).",
+            schema=_schema(
+                {
+                    "requests": {"type": "array", "items": {"type": "object"}, "description": "describe_tables 인자 객체 목록"}
+                },
+                ["requests"]
+            ),
+            handler=_spec_handler(ArgSpec(_lazy(get_db_service, "describe_many"), ("requests",)))
         ),
         ToolDefinition(
             name="run_query",
@@ -463,7 +373,18 @@ def _build_tool_definitions() -> List[ToolDefinition]:
                 },
                 ["query"]
             ),
-            handler=_handle_run_query
+            handler=_spec_handler(ArgSpec(
+                _lazy(get_db_service, "run_query"),
+                ("query",),
+                (
+                    ("db_name", None),
+                    ("connection_string", None),
+                    ("parameters", None),
+                    ("limit", 100),
+                    ("mode", "read_only"),
+                    *_DB_CREDENTIAL_OPTIONS
+                )
+            ))
         ),
         ToolDefinition(
             name="sync_official_docs",
@@ -475,13 +396,13 @@ def _build_tool_definitions() -> List[ToolDefinition]:
                 },
                 None
             ),
-            handler=_handle_sync_official_docs
+            handler=_spec_handler(ArgSpec(_sync_official_docs, optional=(("names", None), ("force", False))))
         ),
         ToolDefinition(
             name="list_official_docs",
             description="미러링된 공식 문서 목록을 조회합니다.",
             schema=_schema({}, None),
-            handler=_handle_list_official_docs
+            handler=_spec_handler(ArgSpec(partial(_run_docs_cached, _lazy(get_official_docs_service, "list_docs"))))
         ),
         ToolDefinition(
             name="search_official_docs",
@@ -494,7 +415,11 @@ def _build_tool_definitions() -> List[ToolDefinition]:
                 },
                 ["query"]
             ),
-            handler=_handle_search_official_docs
+            handler=_spec_handler(ArgSpec(
+                partial(_run_docs_cached, _lazy(get_official_docs_service, "search_docs")),
+                ("query",),
+                (("name", None), ("limit", 5))
+            ))
         ),
         ToolDefinition(
             name="github_cli_execute",
@@ -520,7 +445,10 @@ def _build_tool_definitions() -> List[ToolDefinition]:
                 },
                 None
             ),
-            handler=_handle_github_list_repos
+            handler=_spec_handler(ArgSpec(
+                partial(_run_github_cached, _lazy(get_github_service, "list_repos")),
+                optional=(("owner", None), ("visibility", None), ("limit", 20), ("sort", "updated"))
+            ))
         ),
         ToolDefinition(
             name="github_list_pull_requests",
@@ -533,7 +461,7 @@ def _build_tool_definitions() -> List[ToolDefinition]:
                 },
                 ["repo"]
             ),
-            handler=_handle_github_list_prs
+            handler=_spec_handler(ArgSpec(partial(_run_github_cached, _lazy(get_github_service, "list_pull_requests")), ("repo",), (("state", "open"), ("limit", 20))))
         ),
         ToolDefinition(
             name="github_list_issues",
@@ -546,7 +474,7 @@ def _build_tool_definitions() -> List[ToolDefinition]:
                 },
                 ["repo"]
             ),
-            handler=_handle_github_list_issues
+            handler=_spec_handler(ArgSpec(partial(_run_github_cached, _lazy(get_github_service, "list_issues")), ("repo",), (("state", "open"), ("limit", 20))))
         )
     ]
 
@@ -560,62 +488,74 @@ app = Server("gary-mcp-server")
 
 # 프록시 서비스 초기화 (비동기)
 _proxy_initialized = False
+_proxy_init_lock = asyncio.Lock()
+_proxy_init_task: asyncio.Task[None] | None = None
+
+
+# 도구 이름 접두사(끝의 "_" 제외) → 프록시 이름
+_PROXY_PREFIX_MAP: Dict[str, str] = {
+    "sequential-thinking": "sequential-thinking",
+    "sequential_thinking": "sequential-thinking",
+    "thinking": "sequential-thinking",
+    "chrome-devtools": "chrome-devtools",
+    "chrome_devtools": "chrome-devtools",
+    "chrome": "chrome-devtools",
+}
 
 
-def _to_text_content(payload: Any) -> TextContent:
-    return TextContent(type="text", text=json.dumps(payload, ensure_ascii=False, indent=JSON_INDENT))
+def _resolve_proxy_name(tool_name: str, prefix_map: Dict[str, str]) -> str | None:
+    """도구 이름의 "_" 구분 접두사를 긴 것부터 조회해 프록시 이름을 찾습니다."""
+    parts = tool_name.split("_")
+    for count in range(len(parts) - 1, 0, -1):
+        proxy_name = prefix_map.get("_".join(parts[:count]))
+        if proxy_name:
+            return proxy_name
+    return None
 
 
 async def _initialize_proxies() -> None:
     """프록시 서비스를 초기화하고 도구를 등록합니다."""
+    async with _proxy_init_lock:
+        await _initialize_proxies_locked()
+
+
+async def _initialize_proxies_locked() -> None:
     global _proxy_initialized
+    # 동시에 대기하던 호출은 먼저 끝난 초기화 결과를 그대로 사용
     if _proxy_initialized:
         return
     
     try:
         await mcp_proxy_service.initialize()
         proxy_tools = await mcp_proxy_service.list_proxy_tools()
+        # 기본 별칭 + 실제 등록된 프록시의 접두사
+        prefix_map = {**_PROXY_PREFIX_MAP, **mcp_proxy_service.manager.prefix_map()}
+        # 새 딕셔너리에 추가한 뒤 한 번에 교체 (조회 중인 요청과 충돌 방지)
+        new_definitions = dict(tool_registry.definitions)
         
         # 프록시 도구를 동적으로 등록
         for tool_info in proxy_tools.get("tools", []):
             if tool_info.get("error"):
                 continue  # 오류가 있는 도구는 건너뛰기
             
-            tool_name = tool_info["name"]
+            tool_name = sys.intern(tool_info["name"])
             original_name = tool_info.get("original_name", tool_name)
             
-            # 프록시 이름에서 프록시 서버 식별
-            proxy_name = None
-            for name in ["sequential-thinking", "chrome-devtools"]:
-                if tool_name.startswith(f"{name}_") or tool_name.startswith(f"{name.replace('-', '_')}_"):
-                    proxy_name = name
-                    break
-            
-            if not proxy_name:
-                # 네임스페이스 접두사로 프록시 식별
-                if tool_name.startswith("thinking_"):
-                    proxy_name = "sequential-thinking"
-                elif tool_name.startswith("chrome_"):
-                    proxy_name = "chrome-devtools"
+            # 네임스페이스 접두사로 프록시 서버 식별
+            proxy_name = _resolve_proxy_name(tool_name, prefix_map)
             
             if proxy_name:
-                # 프록시 도구 핸들러 생성 (클로저 문제 방지를 위해 로컬 변수 캡처)
-                pname = proxy_name
-                oname = original_name
-                
-                async def proxy_handler(args: dict[str, Any]) -> Any:
-                    return await mcp_proxy_service.call_proxy_tool(pname, oname, args)
-                
-                # ToolDefinition 생성 및 등록
+                # ToolDefinition 생성 및 등록 (핸들러는 프록시/원래 이름을 고정한 partial)
                 proxy_def = ToolDefinition(
                     name=tool_name,
                     description=tool_info.get("description", f"Proxy tool from {proxy_name}"),
                     schema=tool_info.get("inputSchema", {}),
-                    handler=proxy_handler
+                    handler=partial(mcp_proxy_service.call_proxy_tool, proxy_name, original_name)
                 )
                 
-                # ToolRegistry에 동적으로 추가 (내부 딕셔너리에 직접 추가)
-                tool_registry._definitions[tool_name] = proxy_def
+                new_definitions[tool_name] = proxy_def
+        
+        tool_registry.replace(new_definitions)
     except Exception as e:
         # 프록시 초기화 실패는 무시 (기본 도구는 계속 사용 가능)
         pass
@@ -625,34 +565,49 @@ async def _initialize_proxies() -> None:
 
 @app.list_tools()
 async def list_tools() -> List[Tool]:
-    # 프록시 도구 초기화 (최초 1회)
-    await _initialize_proxies()
+    # 시작 시 띄운 프록시 초기화가 아직 진행 중이면 완료까지 대기 (이후에는 즉시 통과)
+    if not _proxy_initialized:
+        await _initialize_proxies()
     return tool_registry.list_tools()
 
 
 @app.call_tool()
 async def call_tool(name: str, arguments: dict[str, Any]) -> Sequence[TextContent]:
-    # 프록시 도구 초기화 (최초 1회)
-    await _initialize_proxies()
+    # 시작 시 띄운 프록시 초기화가 아직 진행 중이면 완료까지 대기 (이후에는 즉시 통과)
+    if not _proxy_initialized:
+        await _initialize_proxies()
     
-    handler = tool_registry.get_handler(name)
+    handler = tool_registry.handlers.get(name)
     if handler is None:
-        return [_to_text_content({"error": f"Unknown tool: {name}"})]
+        return [_error_content(f"Unknown tool: {name}")]
+    # 필수 인자는 스키마 기준으로 한 곳에서 검증
+    missing = tool_registry.missing_argument(name, arguments)
+    if missing is not None:
+        return [_error_content(f"Missing required argument: {missing}")]
 
     try:
         result = await handler(arguments)
-        return [_to_text_content(result)]
-    except ValueError as exc:
-        return [_to_text_content({"error": str(exc)})]
-    except Exception as exc:  # pragma: no cover - 최상위 보호
-        return [_to_text_content({"error": str(exc)})]
+    except Exception as exc:  # 핸들러 오류(ValueError 포함)는 오류 응답으로 변환
+        return [_error_content(str(exc))]
+    return _to_text_contents(result)
 
 
 async def main() -> None:
     """MCP 서버를 실행합니다."""
-    async with stdio_server() as streams:
-        await app.run(streams[0], streams[1], app.create_initialization_options())
+    global _proxy_init_task
+    # 프록시 핸드셰이크를 첫 요청이 아닌 서버 시작 시점에 백그라운드로 수행
+    _proxy_init_task = asyncio.create_task(_initialize_proxies())
+    try:
+        async with stdio_server() as streams:
+            await app.run(streams[0], streams[1], app.create_initialization_options())
+    finally:
+        # 아직 끝나지 않은 프록시 초기화는 취소하고, 띄운 프록시 하위 프로세스를 모두 종료
+        _proxy_init_task.cancel()
+        await asyncio.gather(_proxy_init_task, return_exceptions=True)
+        await mcp_proxy_service.manager.disconnect_all()
+        # 프로세스 종료 전에 DB 커넥션 풀 등 공유 자원 정리
+        await close_services()
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    event_loop.run(main())
@@ -2,25 +2,28 @@
 
 from __future__ import annotations
 
-import asyncio
 from typing import Any, Dict
 
-from src.servers.base_server import BaseMCPServer, ToolDefinition, require, schema
-from src.tools.aws_tool import AWSService
+from src.servers.base_server import BaseMCPServer, ToolDefinition, schema
+from src.services import get_aws_service
+from src.utils import event_loop
 
-aws_service = AWSService()
+aws_service = get_aws_service()
+
+# 선택 인자 목록이 없을 때 매번 새 리스트를 만들지 않도록 공유하는 빈 튜플
+_EMPTY_ARGS: tuple[str, ...] = ()
 
 
 async def _handle_aws_cli_execute(arguments: dict[str, Any]) -> Any:
-    service = require(arguments, "service")
-    operation = require(arguments, "operation")
-    additional_args = arguments.get("additional_args") or []
+    service = arguments["service"]
+    operation = arguments["operation"]
+    additional_args = arguments.get("additional_args") or _EMPTY_ARGS
     return await aws_service.execute(service, operation, additional_args)
 
 
 async def _handle_aws_list_resources(arguments: dict[str, Any]) -> Any:
     return await aws_service.list_resources(
-        require(arguments, "service"),
+        arguments["service"],
         arguments.get("resource_type")
     )
 
@@ -70,9 +73,13 @@ def build_tool_definitions() -> list[ToolDefinition]:
     ]
 
 
+# 도구 정의는 모듈 로드 시 한 번만 만들고 서버 생성 시 재사용
+TOOL_DEFINITIONS: tuple[ToolDefinition, ...] = tuple(build_tool_definitions())
+
+
 def create_server() -> BaseMCPServer:
     """AWS 서버를 생성합니다."""
-    return BaseMCPServer("aws-mcp", build_tool_definitions())
+    return BaseMCPServer("aws-mcp", TOOL_DEFINITIONS)
 
 
 async def main() -> None:
@@ -82,5 +89,5 @@ async def main() -> None:
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    event_loop.run(main())
 
@@ -3,16 +3,21 @@
 from __future__ import annotations
 
 import asyncio
-import json
+import sys
 from dataclasses import dataclass
-from typing import Any, Awaitable, Callable, Dict, List, Sequence
+from operator import itemgetter
+from types import MappingProxyType
+from typing import Any, Awaitable, Callable, Dict, List, Mapping, Sequence
 
 from mcp.server import Server
 from mcp.server.stdio import stdio_server
 from mcp.types import Tool, TextContent
 
+from src.services import close_services
+from src.utils import json_utils
+from src.utils.env_settings import env_int
+
 ToolHandler = Callable[[dict[str, Any]], Awaitable[Any]]
-JSON_INDENT = 2
 
 
 @dataclass(frozen=True, slots=True)
@@ -21,55 +26,191 @@ class ToolDefinition:
 
     name: str
     description: str
-    schema: Dict[str, Any]
+    schema: Mapping[str, Any]
     handler: ToolHandler
 
 
 class ToolRegistry:
     """ToolDefinition을 관리하고 MCP Server에 노출합니다."""
 
+    __slots__ = ("_definitions", "_tools_cache", "handlers", "required")
+
     def __init__(self, definitions: Sequence[ToolDefinition]) -> None:
-        self._definitions = {definition.name: definition for definition in definitions}
+        # 고정된 도구 이름은 intern 해 두어 조회 시 동일 객체 비교로 끝나도록 함
+        self._definitions = {sys.intern(definition.name): definition for definition in definitions}
+        self._tools_cache = self._build_tools(self._definitions)
+        # 도구 호출 시 정의를 거치지 않고 바로 찾는 이름 → 핸들러 / 필수 인자 테이블
+        self.handlers = self._build_handlers(self._definitions)
+        self.required = self._build_required(self._definitions)
 
     def list_tools(self) -> List[Tool]:
+        # 정의가 바뀔 때 미리 만들어 둔 Tool 목록을 그대로 반환
+        return self._tools_cache
+
+    @staticmethod
+    def _build_tools(definitions: Dict[str, ToolDefinition]) -> List[Tool]:
         return [
             Tool(
                 name=definition.name,
                 description=definition.description,
                 inputSchema=definition.schema
             )
-            for definition in self._definitions.values()
+            for definition in definitions.values()
         ]
 
-    def get_handler(self, name: str) -> ToolHandler | None:
-        definition = self._definitions.get(name)
-        return definition.handler if definition else None
+    @staticmethod
+    def _build_handlers(definitions: Dict[str, ToolDefinition]) -> Dict[str, ToolHandler]:
+        return {name: definition.handler for name, definition in definitions.items()}
+
+    @staticmethod
+    def _build_required(definitions: Dict[str, ToolDefinition]) -> Dict[str, tuple[str, ...]]:
+        return {
+            name: tuple(definition.schema.get("required") or ())
+            for name, definition in definitions.items()
+        }
+
+    def missing_argument(self, name: str, arguments: Mapping[str, Any]) -> str | None:
+        """스키마의 required 중 arguments에 없는 첫 번째 키를 반환합니다."""
+        for key in self.required.get(name, ()):
+            if key not in arguments:
+                return key
+        return None
 
+    @property
+    def definitions(self) -> Dict[str, ToolDefinition]:
+        """현재 도구 정의 (읽기 전용으로 취급)."""
+        return self._definitions
 
-def schema(properties: Dict[str, Any], required: Sequence[str] | None = None) -> Dict[str, Any]:
-    """JSON 스키마 생성 헬퍼."""
-    return {
+    def replace(self, definitions: Dict[str, ToolDefinition]) -> None:
+        """도구 정의를 새 딕셔너리로 통째로 교체합니다 (copy-on-write).
+
+        읽는 쪽은 항상 이전 또는 새 딕셔너리 전체를 보게 되므로 락이 필요 없습니다.
+        """
+        self._tools_cache = self._build_tools(definitions)
+        self.handlers = self._build_handlers(definitions)
+        self.required = self._build_required(definitions)
+        self._definitions = definitions
+
+
+def schema(properties: Dict[str, Any], required: Sequence[str] | None = None) -> Mapping[str, Any]:
+    """JSON 스키마 생성 헬퍼 (모듈 로드 시 한 번 만들어 공유하는 읽기 전용 매핑)."""
+    if not properties and not required:
+        return EMPTY_SCHEMA
+    return MappingProxyType({
         "type": "object",
-        "properties": properties,
-        "required": list(required or [])
-    }
+        "properties": {name: _shared_fragment(prop) for name, prop in properties.items()},
+        # jsonschema 메타스키마는 required를 array(list)로만 인정
+        "required": [sys.intern(key) for key in required or ()]
+    })
+
 
+# 도구 간에 똑같이 반복되는 속성 스키마(DB 자격 증명 옵션 등)를 하나의 객체로 공유
+_FRAGMENTS: Dict[Any, Dict[str, Any]] = {}
 
-def require(arguments: dict[str, Any], key: str) -> Any:
-    """필수 인자 검증."""
-    if key not in arguments:
-        raise ValueError(f"Missing required argument: {key}")
-    return arguments[key]
+
+def _shared_fragment(prop: Dict[str, Any]) -> Dict[str, Any]:
+    try:
+        key = tuple(sorted(prop.items()))
+        hash(key)
+    except TypeError:  # 중첩 dict("items" 등)가 있으면 그대로 사용
+        return prop
+    shared = _FRAGMENTS.get(key)
+    if shared is None:
+        shared = _FRAGMENTS[key] = {
+            name: sys.intern(value) if isinstance(value, str) else value
+            for name, value in prop.items()
+        }
+    return shared
+
+
+# 인자가 없는 도구들이 함께 쓰는 스키마
+EMPTY_SCHEMA: Mapping[str, Any] = MappingProxyType({
+    "type": "object",
+    "properties": {},
+    "required": []
+})
+
+
+ArgExtractor = Callable[[Mapping[str, Any]], tuple[Any, ...]]
+
+
+def arg_extractor(required: Sequence[str], defaults: Mapping[str, Any]) -> ArgExtractor:
+    """arguments에서 (필수..., 선택...) 순서의 위치 인자 튜플을 꺼내는 함수를 미리 만듭니다.
+
+    키 목록과 itemgetter는 도구 정의 시 한 번만 만들고, 호출 시에는 기본값을 병합해 한 번에 꺼냅니다.
+    """
+    keys = (*required, *defaults)
+    frozen_defaults = MappingProxyType(dict(defaults))
+    getter = itemgetter(*keys) if keys else None
+    single = len(keys) == 1
+
+    def extract(arguments: Mapping[str, Any]) -> tuple[Any, ...]:
+        if getter is None:
+            return ()
+        try:
+            values = getter({**frozen_defaults, **arguments})
+        except KeyError as exc:
+            raise ValueError(f"Missing required argument: {exc.args[0]}") from None
+        return (values,) if single else values
+
+    return extract
 
 
 def to_text_content(payload: Any) -> TextContent:
     """결과를 TextContent로 변환."""
-    return TextContent(type="text", text=json.dumps(payload, ensure_ascii=False, indent=JSON_INDENT))
+    return TextContent(type="text", text=json_utils.dumps_text(payload))
+
+
+# 목록이 이 개수를 넘으면 여러 TextContent로 나눠 직렬화 (GARY_MCP_CHUNK_ITEMS로 조정)
+RESPONSE_CHUNK_ITEMS = env_int("GARY_MCP_CHUNK_ITEMS", 50, minimum=1)
+# 큰 목록이 담기는 응답 키 (run_query rows, 문서 검색 matches 등)
+_CHUNKABLE_KEYS = ("rows", "matches", "results", "docs")
+
+
+def to_text_contents(payload: Any) -> List[TextContent]:
+    """결과를 TextContent 목록으로 변환합니다.
+
+    큰 목록은 한 번에 거대한 문자열로 만들지 않고 요약 + 항목 묶음 단위로 나눠 직렬화합니다.
+    mcp Server는 길이 2인 tuple 반환값을 (비정형, 정형) 결과 쌍으로 해석하므로 항상 list로 반환합니다.
+    """
+    if isinstance(payload, dict):
+        for key in _CHUNKABLE_KEYS:
+            items = payload.get(key)
+            if isinstance(items, list) and len(items) > RESPONSE_CHUNK_ITEMS:
+                return _chunked_contents(payload, key, items)
+    return [to_text_content(payload)]
+
+
+def _chunked_contents(payload: Dict[str, Any], key: str, items: List[Any]) -> List[TextContent]:
+    size = RESPONSE_CHUNK_ITEMS
+    starts = range(0, len(items), size)
+    head = {name: value for name, value in payload.items() if name != key}
+    head["chunked"] = {"key": key, "items": len(items), "chunks": len(starts)}
+    contents = [to_text_content(head)]
+    contents.extend(
+        to_text_content({key: items[start:start + size], "chunk": index})
+        for index, start in enumerate(starts)
+    )
+    return contents
+
+
+# {"error": ...} 응답 틀 (dumps_text 출력과 동일한 형태, 메시지 값만 인코딩)
+_ERROR_TEMPLATE = '{{\n  "error": {}\n}}' if json_utils.PRETTY else '{{"error":{}}}'
+
+
+def error_content(message: str) -> TextContent:
+    """{"error": message} 응답을 TextContent로 변환."""
+    return TextContent(
+        type="text",
+        text=_ERROR_TEMPLATE.format(json_utils.dumps_bytes(message).decode("utf-8"))
+    )
 
 
 class BaseMCPServer:
     """공통 MCP 서버 베이스 클래스."""
 
+    __slots__ = ("server_name", "tool_registry", "app")
+
     def __init__(self, server_name: str, tool_definitions: Sequence[ToolDefinition]) -> None:
         self.server_name = server_name
         self.tool_registry = ToolRegistry(tool_definitions)
@@ -85,22 +226,28 @@ class BaseMCPServer:
 
     async def call_tool(self, name: str, arguments: dict[str, Any]) -> Sequence[TextContent]:
         """도구를 호출합니다."""
-        handler = self.tool_registry.get_handler(name)
+        handler = self.tool_registry.handlers.get(name)
         if handler is None:
-            return [to_text_content({"error": f"Unknown tool: {name}"})]
+            return [error_content(f"Unknown tool: {name}")]
+        # 필수 인자는 스키마 기준으로 한 곳에서 검증
+        missing = self.tool_registry.missing_argument(name, arguments)
+        if missing is not None:
+            return [error_content(f"Missing required argument: {missing}")]
 
         try:
             result = await handler(arguments)
-            return [to_text_content(result)]
-        except ValueError as exc:
-            return [to_text_content({"error": str(exc)})]
-        except Exception as exc:  # pragma: no cover
-            return [to_text_content({"error": str(exc)})]
+        except Exception as exc:  # 핸들러 오류(ValueError 포함)는 오류 응답으로 변환
+            return [error_content(str(exc))]
+        return to_text_contents(result)
 
     async def run(self) -> None:
         """MCP 서버를 실행합니다."""
-        async with stdio_server() as streams:
-            await self.app.run(streams[0], streams[1], self.app.create_initialization_options())
+        try:
+            async with stdio_server() as streams:
+                await self.app.run(streams[0], streams[1], self.app.create_initialization_options())
+        finally:
+            # 프로세스 종료 전에 DB 커넥션 풀 등 공유 자원 정리
+            await close_services()
 
 
 async def main(server: BaseMCPServer) -> None:
@@ -2,57 +2,64 @@
 
 from __future__ import annotations
 
-import asyncio
 from typing import Any, Dict
 
-from src.servers.base_server import BaseMCPServer, ToolDefinition, require, schema
-from src.tools.db_tool import DatabaseService
-
-db_service = DatabaseService()
+from src.servers.base_server import BaseMCPServer, ToolDefinition, arg_extractor, schema
+from src.services import get_db_service
+from src.utils import event_loop
+
+db_service = get_db_service()
+
+
+# DB 도구 공통 자격 증명 옵션 (서비스 메서드 인자 순서, 각 추출기에서 한 번에 병합)
+_CREDENTIAL_DEFAULTS: Dict[str, Any] = {
+    "use_dotenv": True,
+    "use_aws_secrets": False,
+    "aws_secret_name": None,
+    "use_github_secrets": False,
+    "github_secret_name": None,
+    "github_repo": None,
+}
+
+_LIST_DATABASES_ARGS = arg_extractor((), {
+    "db_name": None,
+    "connection_string": None,
+    **_CREDENTIAL_DEFAULTS,
+})
+_DESCRIBE_TABLES_ARGS = arg_extractor((), {
+    "db_name": None,
+    "connection_string": None,
+    "database": None,
+    **_CREDENTIAL_DEFAULTS,
+})
+_RUN_QUERY_ARGS = arg_extractor(("query",), {
+    "db_name": None,
+    "connection_string": None,
+    "parameters": None,
+    "limit": 100,
+    "mode": "read_only",
+    **_CREDENTIAL_DEFAULTS,
+})
 
 
 async def _handle_list_databases(arguments: dict[str, Any]) -> Any:
-    return await db_service.list_databases(
-        arguments.get("db_name"),
-        arguments.get("connection_string"),
-        arguments.get("use_dotenv", True),
-        arguments.get("use_aws_secrets", False),
-        arguments.get("aws_secret_name"),
-        arguments.get("use_github_secrets", False),
-        arguments.get("github_secret_name"),
-        arguments.get("github_repo")
-    )
+    return await db_service.list_databases(*_LIST_DATABASES_ARGS(arguments))
 
 
 async def _handle_describe_tables(arguments: dict[str, Any]) -> Any:
-    return await db_service.describe_tables(
-        arguments.get("db_name"),
-        arguments.get("connection_string"),
-        arguments.get("database"),
-        arguments.get("use_dotenv", True),
-        arguments.get("use_aws_secrets", False),
-        arguments.get("aws_secret_name"),
-        arguments.get("use_github_secrets", False),
-        arguments.get("github_secret_name"),
-        arguments.get("github_repo")
-    )
+    return await db_service.describe_tables(*_DESCRIBE_TABLES_ARGS(arguments))
+
+
+async def _handle_list_databases_many(arguments: dict[str, Any]) -> Any:
+    return await db_service.list_databases_many(arguments["requests"])
+
+
+async def _handle_describe_many(arguments: dict[str, Any]) -> Any:
+    return await db_service.describe_many(arguments["requests"])
 
 
 async def _handle_run_query(arguments: dict[str, Any]) -> Any:
-    return await db_service.run_query(
-        require(arguments, "query"),
-        arguments.get("db_name"),
-        arguments.get("connection_string"),
-        arguments.get("parameters"),
-        arguments.get("limit", 100),
-        arguments.get("mode", "read_only"),
-        arguments.get("use_dotenv", True),
-        arguments.get("use_aws_secrets", False),
-        arguments.get("aws_secret_name"),
-        arguments.get("use_github_secrets", False),
-        arguments.get("github_secret_name"),
-        arguments.get("github_repo")
-    )
+    return await db_service.run_query(*_RUN_QUERY_ARGS(arguments))
 
 
 def build_tool_definitions() -> list[ToolDefinition]:
@@ -95,6 +102,28 @@ def build_tool_definitions() -> list[ToolDefinition]:
             ),
             handler=_handle_describe_tables
         ),
+        ToolDefinition(
+            name="list_databases_many",
+            description="여러 연결의 데이터베이스 목록을 한 번에 조회합니다 (요청별 병렬 실행, 결과는 요청 순서).",
+            schema=schema(
+                {
+                    "requests": {"type": "array", "items": {"type": "object"}, "description": "list_databases 인자 객체 목록"}
+                },
+                ["requests"]
+            ),
+            handler=_handle_list_databases_many
+        ),
+        ToolDefinition(
+            name="describe_many",
+            description="여러 연결/데이터베이스의 테이블 스키마를 한 번에 조회합니다 (요청별 병렬 실행, 결과는 요청 순서).",
+            schema=schema(
+                {
+                    "requests": {"type": "array", "items": {"type": "object"}, "description": "describe_tables 인자 객체 목록"}
+                },
+                ["requests"]
+            ),
+            handler=_handle_describe_many
+        ),
         ToolDefinition(
             name="run_query",
             description="SQL 쿼리를 실행합니다 (기본 read-only, 필요시 read-write 모드 지정).",
@@ -120,9 +149,13 @@ def build_tool_definitions() -> list[ToolDefinition]:
     ]
 
 
+# 도구 정의는 모듈 로드 시 한 번만 만들고 서버 생성 시 재사용
+TOOL_DEFINITIONS: tuple[ToolDefinition, ...] = tuple(build_tool_definitions())
+
+
 def create_server() -> BaseMCPServer:
     """데이터베이스 서버를 생성합니다."""
-    return BaseMCPServer("db-mcp", build_tool_definitions())
+    return BaseMCPServer("db-mcp", TOOL_DEFINITIONS)
 
 
 async def main() -> None:
@@ -132,5 +165,5 @@ async def main() -> None:
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    event_loop.run(main())
 
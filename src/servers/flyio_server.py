@@ -2,13 +2,13 @@
 
 from __future__ import annotations
 
-import asyncio
 from typing import Any, Dict
 
-from src.servers.base_server import BaseMCPServer, ToolDefinition, require, schema
-from src.tools.flyio_tool import FlyioService
+from src.servers.base_server import BaseMCPServer, ToolDefinition, schema
+from src.services import get_flyio_service
+from src.utils import event_loop
 
-flyio_service = FlyioService()
+flyio_service = get_flyio_service()
 
 
 async def _handle_flyio_list_apps(_: dict[str, Any]) -> Any:
@@ -16,12 +16,12 @@ async def _handle_flyio_list_apps(_: dict[str, Any]) -> Any:
 
 
 async def _handle_flyio_get_status(arguments: dict[str, Any]) -> Any:
-    return await flyio_service.get_status(require(arguments, "app_name"))
+    return await flyio_service.get_status(arguments["app_name"])
 
 
 async def _handle_flyio_get_logs(arguments: dict[str, Any]) -> Any:
     return await flyio_service.get_logs(
-        require(arguments, "app_name"),
+        arguments["app_name"],
         arguments.get("lines", 50)
     )
 
@@ -61,9 +61,13 @@ def build_tool_definitions() -> list[ToolDefinition]:
     ]
 
 
+# 도구 정의는 모듈 로드 시 한 번만 만들고 서버 생성 시 재사용
+TOOL_DEFINITIONS: tuple[ToolDefinition, ...] = tuple(build_tool_definitions())
+
+
 def create_server() -> BaseMCPServer:
     """Fly.io 서버를 생성합니다."""
-    return BaseMCPServer("flyio-mcp", build_tool_definitions())
+    return BaseMCPServer("flyio-mcp", TOOL_DEFINITIONS)
 
 
 async def main() -> None:
@@ -73,5 +77,5 @@ async def main() -> None:
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    event_loop.run(main())
 
@@ -2,46 +2,52 @@
 
 from __future__ import annotations
 
-import asyncio
+from functools import partial
 from typing import Any, Dict
 
-from src.servers.base_server import BaseMCPServer, ToolDefinition, require, schema
-from src.tools.github_tool import GitHubService
+from src.servers.base_server import BaseMCPServer, ToolDefinition, arg_extractor, schema
+from src.services import get_github_service
+from src.utils import event_loop
+from src.utils.ttl_cache import TTLCache, cached_call
 
-github_service = GitHubService()
+github_service = get_github_service()
+
+# 선택 인자 목록이 없을 때 매번 새 리스트를 만들지 않도록 공유하는 빈 튜플
+_EMPTY_ARGS: tuple[str, ...] = ()
+
+
+# 읽기 전용 목록 조회 결과 캐시 (gh 서브프로세스 + 네트워크 왕복 생략)
+_READ_CACHE = TTLCache(maxsize=256, ttl=60.0)
+_run_cached = partial(cached_call, _READ_CACHE)
 
 
 async def _handle_github_cli_execute(arguments: dict[str, Any]) -> Any:
-    command = require(arguments, "command")
-    args_list = arguments.get("args") or []
-    if not isinstance(args_list, list):
+    command = arguments["command"]
+    args_list = arguments.get("args") or _EMPTY_ARGS
+    if not isinstance(args_list, (list, tuple)):
         raise ValueError("args must be an array of strings")
-    return await github_service.execute([command, *args_list])
+    try:
+        return await github_service.execute([command, *args_list])
+    finally:
+        # 임의 명령은 저장소 상태를 바꿀 수 있으므로 목록 캐시를 비움
+        _READ_CACHE.clear()
+
+
+_LIST_REPOS_ARGS = arg_extractor((), {"owner": None, "visibility": None, "limit": 20, "sort": "updated"})
+# PR/이슈 목록 공통 인자 (repo, state, limit)
+_LIST_REPO_ITEMS_ARGS = arg_extractor(("repo",), {"state": "open", "limit": 20})
 
 
 async def _handle_github_list_repos(arguments: dict[str, Any]) -> Any:
-    return await github_service.list_repos(
-        owner=arguments.get("owner"),
-        visibility=arguments.get("visibility"),
-        limit=arguments.get("limit", 20),
-        sort=arguments.get("sort", "updated")
-    )
+    return await _run_cached(github_service.list_repos, *_LIST_REPOS_ARGS(arguments))
 
 
 async def _handle_github_list_prs(arguments: dict[str, Any]) -> Any:
-    return await github_service.list_pull_requests(
-        repo=require(arguments, "repo"),
-        state=arguments.get("state", "open"),
-        limit=arguments.get("limit", 20)
-    )
+    return await _run_cached(github_service.list_pull_requests, *_LIST_REPO_ITEMS_ARGS(arguments))
 
 
 async def _handle_github_list_issues(arguments: dict[str, Any]) -> Any:
-    return await github_service.list_issues(
-        repo=require(arguments, "repo"),
-        state=arguments.get("state", "open"),
-        limit=arguments.get("limit", 20)
-    )
+    return await _run_cached(github_service.list_issues, *_LIST_REPO_ITEMS_ARGS(arguments))
 
 
 def build_tool_definitions() -> list[ToolDefinition]:
@@ -102,9 +108,13 @@ def build_tool_definitions() -> list[ToolDefinition]:
     ]
 
 
+# 도구 정의는 모듈 로드 시 한 번만 만들고 서버 생성 시 재사용
+TOOL_DEFINITIONS: tuple[ToolDefinition, ...] = tuple(build_tool_definitions())
+
+
 def create_server() -> BaseMCPServer:
     """GitHub 서버를 생성합니다."""
-    return BaseMCPServer("github-mcp", build_tool_definitions())
+    return BaseMCPServer("github-mcp", TOOL_DEFINITIONS)
 
 
 async def main() -> None:
@@ -114,5 +124,5 @@ async def main() -> None:
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    event_loop.run(main())
 
@@ -2,57 +2,58 @@
 
 from __future__ import annotations
 
-import asyncio
+from functools import partial
 from typing import Any, Dict
 
-from src.servers.base_server import BaseMCPServer, ToolDefinition, require, schema
-from src.tools.docs_service import DocsService
+from src.servers.base_server import BaseMCPServer, ToolDefinition, arg_extractor, schema
+from src.services import get_docs_service, run_in_docs_executor
+from src.utils import event_loop
+from src.utils.ttl_cache import TTLCache, cached_call
 
-docs_service = DocsService()
+docs_service = get_docs_service()
+
+# 문서 목록/검색 결과 캐시 (동기화 시 비움)
+_DOCS_CACHE = TTLCache(maxsize=256, ttl=60.0)
+
+
+# 캐시 조회는 이벤트 루프에서 처리해 적중 시 스레드 풀을 거치지 않음
+_run_cached = partial(cached_call, _DOCS_CACHE, runner=run_in_docs_executor)
 
 
 async def _handle_sync_official_docs(arguments: dict[str, Any]) -> Any:
-    return await asyncio.to_thread(
-        docs_service.sync_official_docs,
-        arguments.get("names"),
-        arguments.get("force", False)
-    )
+    try:
+        return await run_in_docs_executor(
+            docs_service.sync_official_docs,
+            arguments.get("names"),
+            arguments.get("force", False)
+        )
+    finally:
+        _DOCS_CACHE.clear()
 
 
 async def _handle_list_official_docs(_: dict[str, Any]) -> Any:
-    return await asyncio.to_thread(docs_service.list_official_docs)
+    return await _run_cached(docs_service.list_official_docs)
+
+
+_SEARCH_DOCS_ARGS = arg_extractor(("query",), {"name": None, "limit": 5, "structured": False})
+_GET_LIBRARY_DOCS_ARGS = arg_extractor(("library_id",), {"mode": "info", "topic": None, "limit": 5})
+_LIST_LIBRARIES_ARGS = arg_extractor((), {"category": None, "available_only": False})
 
 
 async def _handle_search_official_docs(arguments: dict[str, Any]) -> Any:
-    return await asyncio.to_thread(
-        docs_service.search_docs,
-        require(arguments, "query"),
-        arguments.get("name"),
-        arguments.get("limit", 5),
-        arguments.get("structured", False),
-    )
+    return await _run_cached(docs_service.search_docs, *_SEARCH_DOCS_ARGS(arguments))
 
 
 async def _handle_resolve_library_id(arguments: dict[str, Any]) -> Any:
-    return await asyncio.to_thread(docs_service.resolve_library_id, require(arguments, "name"))
+    return await _run_cached(docs_service.resolve_library_id, arguments["name"])
 
 
 async def _handle_get_library_docs(arguments: dict[str, Any]) -> Any:
-    return await asyncio.to_thread(
-        docs_service.get_library_docs,
-        require(arguments, "library_id"),
-        arguments.get("mode", "info"),
-        arguments.get("topic"),
-        arguments.get("limit", 5),
-    )
+    return await _run_cached(docs_service.get_library_docs, *_GET_LIBRARY_DOCS_ARGS(arguments))
 
 
 async def _handle_list_libraries(arguments: dict[str, Any]) -> Any:
-    return await asyncio.to_thread(
-        docs_service.list_libraries,
-        arguments.get("category"),
-        arguments.get("available_only", False),
-    )
+    return await _run_cached(docs_service.list_libraries, *_LIST_LIBRARIES_ARGS(arguments))
 
 
 def build_tool_definitions() -> list[ToolDefinition]:
@@ -128,9 +129,13 @@ def build_tool_definitions() -> list[ToolDefinition]:
     ]
 
 
+# 도구 정의는 모듈 로드 시 한 번만 만들고 서버 생성 시 재사용
+TOOL_DEFINITIONS: tuple[ToolDefinition, ...] = tuple(build_tool_definitions())
+
+
 def create_server() -> BaseMCPServer:
     """공식 문서 서버를 생성합니다."""
-    return BaseMCPServer("official-docs-mcp", build_tool_definitions())
+    return BaseMCPServer("official-docs-mcp", TOOL_DEFINITIONS)
 
 
 async def main() -> None:
@@ -140,5 +145,5 @@ async def main() -> None:
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    event_loop.run(main())
 
@@ -2,18 +2,18 @@
 
 from __future__ import annotations
 
-import asyncio
 from typing import Any, Dict
 
-from src.servers.base_server import BaseMCPServer, ToolDefinition, require, schema
-from src.tools.pdf_tool import PDFService
+from src.servers.base_server import BaseMCPServer, ToolDefinition, schema
+from src.services import get_pdf_service
+from src.utils import event_loop
 
-pdf_service = PDFService()
+pdf_service = get_pdf_service()
 
 
 async def _handle_markdown_to_pdf(arguments: dict[str, Any]) -> Any:
     return await pdf_service.convert(
-        require(arguments, "markdown_path"),
+        arguments["markdown_path"],
         arguments.get("output_path"),
         arguments.get("css_path")
     )
@@ -38,9 +38,13 @@ def build_tool_definitions() -> list[ToolDefinition]:
     ]
 
 
+# 도구 정의는 모듈 로드 시 한 번만 만들고 서버 생성 시 재사용
+TOOL_DEFINITIONS: tuple[ToolDefinition, ...] = tuple(build_tool_definitions())
+
+
 def create_server() -> BaseMCPServer:
     """PDF 서버를 생성합니다."""
-    return BaseMCPServer("pdf-mcp", build_tool_definitions())
+    return BaseMCPServer("pdf-mcp", TOOL_DEFINITIONS)
 
 
 async def main() -> None:
@@ -50,5 +54,5 @@ async def main() -> None:
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    event_loop.run(main())
 
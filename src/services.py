@@ -0,0 +1,105 @@
+"""프로세스 전역에서 공유하는 서비스 싱글톤.
+
+server.py와 src/servers/*가 같은 프로세스에 함께 로드되어도 서비스는 한 번만 생성됩니다.
+각 서비스 모듈은 처음 요청될 때 import 하므로 쓰지 않는 서비스는 초기화 비용이 없습니다.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
+from typing import TYPE_CHECKING, Any, Callable
+
+if TYPE_CHECKING:
+    from src.tools.aws_tool import AWSService
+    from src.tools.code_analysis_tool import CodeAnalysisService
+    from src.tools.db_tool import DatabaseService
+    from src.tools.docs_service import DocsService
+    from src.tools.document_tool import DocumentService
+    from src.tools.flyio_tool import FlyioService
+    from src.tools.github_tool import GitHubService
+    from src.tools.official_docs import OfficialDocsService
+    from src.tools.pdf_tool import PDFService
+
+
+@lru_cache(maxsize=None)
+def get_aws_service() -> AWSService:
+    from src.tools.aws_tool import AWSService
+    return AWSService()
+
+
+@lru_cache(maxsize=None)
+def get_code_analysis_service() -> CodeAnalysisService:
+    from src.tools.code_analysis_tool import CodeAnalysisService
+    return CodeAnalysisService()
+
+
+@lru_cache(maxsize=None)
+def get_db_service() -> DatabaseService:
+    from src.tools.db_tool import DatabaseService
+    return DatabaseService()
+
+
+@lru_cache(maxsize=None)
+def get_docs_service() -> DocsService:
+    from src.tools.docs_service import DocsService
+    return DocsService()
+
+
+@lru_cache(maxsize=None)
+def get_document_service() -> DocumentService:
+    from src.tools.document_tool import DocumentService
+    return DocumentService()
+
+
+@lru_cache(maxsize=None)
+def get_flyio_service() -> FlyioService:
+    from src.tools.flyio_tool import FlyioService
+    return FlyioService()
+
+
+@lru_cache(maxsize=None)
+def get_github_service() -> GitHubService:
+    from src.tools.github_tool import GitHubService
+    return GitHubService()
+
+
+@lru_cache(maxsize=None)
+def get_official_docs_service() -> OfficialDocsService:
+    from src.tools.official_docs import OfficialDocsService
+    return OfficialDocsService()
+
+
+@lru_cache(maxsize=None)
+def get_docs_executor() -> ThreadPoolExecutor:
+    """공식 문서 동기화/검색 전용 스레드 풀 (기본 executor와 경합하지 않도록 분리, I/O 위주라 넉넉히 잡음)."""
+    return ThreadPoolExecutor(max_workers=16, thread_name_prefix="official-docs")
+
+
+async def run_in_docs_executor(func: Callable[..., Any], *args: Any) -> Any:
+    return await asyncio.get_running_loop().run_in_executor(get_docs_executor(), partial(func, *args))
+
+
+@lru_cache(maxsize=None)
+def get_pdf_service() -> PDFService:
+    from src.tools.pdf_tool import PDFService
+    return PDFService()
+
+
+async def close_services() -> None:
+    """생성된 서비스가 잡고 있는 연결 자원(DB 엔진 풀, HTTP 세션, 워커 프로세스 등)을 정리합니다."""
+    if get_github_service.cache_info().currsize:
+        await get_github_service().close()
+    if get_code_analysis_service.cache_info().currsize:
+        from src.tools.code_analysis_tool import shutdown_parse_pool
+        shutdown_parse_pool()
+    if get_pdf_service.cache_info().currsize:
+        from src.tools.pdf_tool import shutdown_pdf_pool
+        shutdown_pdf_pool()
+    if get_docs_executor.cache_info().currsize:
+        get_docs_executor().shutdown(wait=False, cancel_futures=True)
+    if get_db_service.cache_info().currsize:
+        await get_db_service().aclose()
+        from src.infrastructure.db.connection_manager import close_all_engines
+        await close_all_engines()
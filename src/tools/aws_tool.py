@@ -2,10 +2,25 @@
 
 from __future__ import annotations
 
+import asyncio
+import threading
 from typing import Any, Dict, Optional, Sequence
 
-from src.tools.cli_executor import CLIService
+from src.tools.cli_executor import CLIResult, CLIService
 from src.utils.env_loader import load_shell_env
+from src.utils.ttl_cache import MISSING, TTLCache
+
+try:
+    import boto3
+    from botocore.exceptions import BotoCoreError, ClientError
+    BOTO3_AVAILABLE = True
+except ImportError:
+    BOTO3_AVAILABLE = False
+
+# aws CLI 서비스 이름 → boto3 클라이언트 이름 (다른 것만)
+_SDK_SERVICE_NAMES = {"s3api": "s3"}
+# SDK 응답에서 CLI 출력에는 없는 메타 필드
+_SDK_META_KEYS = ("ResponseMetadata", "NextToken", "NextMarker", "Marker", "IsTruncated")
 
 
 class AWSService:
@@ -24,12 +39,23 @@ class AWSService:
             json_flag=["--output", "json"],
             extra_env=extra_env
         )
+        # 인자 없는 조회 작업은 aws 바이너리(파이썬 인터프리터 기동) 대신 boto3 클라이언트로 호출
+        self._profile = profile
+        self._region = extra_env.get("AWS_REGION") or extra_env.get("AWS_DEFAULT_REGION")
+        self._sdk_session: Any = None
+        self._sdk_clients: Dict[str, Any] = {}
+        self._sdk_lock = threading.Lock()
+        # 조회 결과 단기 캐시 (idempotent 호출의 성공 결과만 저장)
+        self._read_cache = TTLCache(maxsize=32, ttl=30.0)
+        # 호출자 계정 정보는 프로세스 수명 동안 바뀌지 않으므로 한 번만 조회
+        self._caller_identity: Optional[Dict[str, Any]] = None
 
     async def execute(
         self,
         service: str,
         operation: Optional[str] = None,
-        additional_args: Optional[Sequence[str]] = None
+        additional_args: Optional[Sequence[str]] = None,
+        idempotent: bool = False
     ) -> Dict[str, Any]:
         args = [service]
         if operation:
@@ -37,12 +63,72 @@ class AWSService:
         if additional_args:
             args.extend(additional_args)
 
-        result = await self.cli.run(*args)
-        return result.to_dict()
+        if not idempotent:
+            # 쓰기 가능성이 있는 명령은 이후 조회 결과를 바꿀 수 있으므로 캐시를 비움
+            self._read_cache.clear()
+            return (await self.cli.run(*args)).to_dict()
+
+        key = tuple(args)
+        cached = self._read_cache.get(key)
+        if cached is not MISSING:
+            return cached
+        response = None
+        if operation and not additional_args:
+            response = await self._sdk_call(service, operation)
+        if response is None:
+            response = (await self.cli.run(*args, idempotent=True)).to_dict()
+        if response["success"]:
+            self._read_cache.set(key, response)
+        return response
+
+    async def _sdk_call(self, service: str, operation: str) -> Optional[Dict[str, Any]]:
+        """boto3로 조회 작업을 실행합니다 (SDK로 처리할 수 없으면 None을 반환해 CLI로 폴백)."""
+        if not BOTO3_AVAILABLE:
+            return None
+        sdk_service = _SDK_SERVICE_NAMES.get(service, service)
+        method = operation.replace("-", "_")
+        try:
+            output = await asyncio.to_thread(self._invoke_sdk, sdk_service, method)
+        except ClientError as exc:
+            return CLIResult(success=False, error=str(exc), command=("boto3", f"{sdk_service}.{method}")).to_dict()
+        except (BotoCoreError, AttributeError):
+            # 자격 증명/프로필 문제, 알 수 없는 서비스, CLI 전용 명령(s3 ls 등)은 CLI에 맡김
+            return None
+        return CLIResult(success=True, output=output, command=("boto3", f"{sdk_service}.{method}")).to_dict()
+
+    def _get_sdk_client(self, service: str) -> Any:
+        # boto3 Session은 스레드 안전하지 않으므로 생성은 락 안에서, 클라이언트는 서비스별로 재사용
+        with self._sdk_lock:
+            client = self._sdk_clients.get(service)
+            if client is None:
+                if self._sdk_session is None:
+                    self._sdk_session = boto3.Session(profile_name=self._profile, region_name=self._region)
+                client = self._sdk_session.client(service)
+                self._sdk_clients[service] = client
+            return client
+
+    def _invoke_sdk(self, service: str, method: str) -> Dict[str, Any]:
+        client = self._get_sdk_client(service)
+        call = getattr(client, method)
+        if not client.can_paginate(method):
+            pages = [call()]
+        else:
+            # CLI처럼 모든 페이지를 받아 목록 필드를 이어 붙임
+            pages = client.get_paginator(method).paginate()
+        merged: Dict[str, Any] = {}
+        for page in pages:
+            for key, value in page.items():
+                if key in _SDK_META_KEYS:
+                    continue
+                if isinstance(value, list) and isinstance(merged.get(key), list):
+                    merged[key].extend(value)
+                else:
+                    merged[key] = value
+        return merged
 
     async def list_resources(self, service: str, resource_type: Optional[str] = None) -> Dict[str, Any]:
         operation = "list" if not resource_type else f"list-{resource_type}"
-        return await self.execute(service, operation)
+        return await self.execute(service, operation, idempotent=True)
 
     async def describe_resource(
         self,
@@ -51,13 +137,18 @@ class AWSService:
         resource_type: Optional[str] = None
     ) -> Dict[str, Any]:
         operation = "describe" if not resource_type else f"describe-{resource_type}"
-        return await self.execute(service, operation, [resource_id])
+        return await self.execute(service, operation, [resource_id], idempotent=True)
 
     async def get_account_info(self) -> Dict[str, Any]:
-        return await self.execute("sts", "get-caller-identity")
+        if self._caller_identity is None:
+            response = await self.execute("sts", "get-caller-identity", idempotent=True)
+            if not response["success"]:
+                return response
+            self._caller_identity = response
+        return self._caller_identity
 
     async def list_s3_buckets(self) -> Dict[str, Any]:
-        return await self.execute("s3", "ls")
+        return await self.execute("s3", "ls", idempotent=True)
 
     async def list_ec2_instances(self) -> Dict[str, Any]:
-        return await self.execute("ec2", "describe-instances")
+        return await self.execute("ec2", "describe-instances", idempotent=True)
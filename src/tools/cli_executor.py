@@ -6,8 +6,47 @@ import asyncio
 import json
 from dataclasses import dataclass
 import os
+import random
+import re
+import shlex
 from typing import Any, Iterable, List, Optional, Sequence
 
+from src.utils import json_utils
+from src.utils.env_settings import env_int
+
+_READ_CHUNK_SIZE = 64 * 1024
+# 출력 한도를 넘으면 프로세스를 종료하고 오류로 반환 (GARY_MCP_CLI_MAX_OUTPUT, 바이트, 최소 읽기 단위 하나)
+MAX_OUTPUT_BYTES = env_int("GARY_MCP_CLI_MAX_OUTPUT", 32 * 1024 * 1024, minimum=_READ_CHUNK_SIZE)
+
+
+class OutputLimitExceeded(Exception):
+    """CLI 출력이 max_output_bytes를 넘었을 때 발생합니다."""
+
+
+# 스로틀링/일시적 서버 오류로 보고 재시도할 stderr 패턴 (aws, gh, flyctl)
+_RETRYABLE_ERROR_RE = re.compile(
+    r"throttl|RequestLimitExceeded|TooManyRequests|SlowDown|rate limit"
+    r"|ServiceUnavailable|HTTP 5\d\d|\(5\d\d\)|status code:? 5\d\d",
+    re.IGNORECASE
+)
+
+
+@dataclass(frozen=True, slots=True)
+class RetryPolicy:
+    """일시적 실패에 대한 지수 백오프(지터 포함) 재시도 정책."""
+
+    max_attempts: int = 3
+    base_delay: float = 0.5
+    max_delay: float = 16.0
+    jitter: float = 0.5
+
+    def delay(self, attempt: int) -> float:
+        """attempt번째(0부터) 실패 후 대기할 초."""
+        return min(self.max_delay, self.base_delay * 2 ** attempt) * (1 + random.random() * self.jitter)
+
+
+DEFAULT_RETRY_POLICY = RetryPolicy()
+
 
 @dataclass(slots=True)
 class CLIResult:
@@ -16,16 +55,18 @@ class CLIResult:
     success: bool
     output: Any = ""
     error: Optional[str] = None
-    command: str = ""
+    # 실행한 인자 목록 (문자열 변환은 to_dict에서 필요할 때만 수행)
+    command: tuple[str, ...] = ()
 
     def to_dict(self) -> dict[str, Any]:
-        """MCP 응답에 활용하기 위한 dict 변환."""
-        return {
-            "success": self.success,
-            "output": self.output,
-            "error": self.error,
-            "command": self.command
-        }
+        """MCP 응답에 활용하기 위한 dict 변환 (비어 있는 output/error 키는 생략)."""
+        payload: dict[str, Any] = {"success": self.success}
+        if self.output != "":
+            payload["output"] = self.output
+        if self.error is not None:
+            payload["error"] = self.error
+        payload["command"] = shlex.join(self.command)
+        return payload
 
 
 class CLIService:
@@ -36,49 +77,125 @@ class CLIService:
         binary: str,
         base_args: Optional[Sequence[str]] = None,
         json_flag: Optional[Sequence[str]] = None,
-        extra_env: Optional[dict[str, str]] = None
+        extra_env: Optional[dict[str, str]] = None,
+        max_output_bytes: int = MAX_OUTPUT_BYTES,
+        retry_policy: RetryPolicy = DEFAULT_RETRY_POLICY
     ) -> None:
         self.binary = binary
         self.base_args = list(base_args or [])
         self.json_flag = list(json_flag) if json_flag else None
+        # 출력 형식 플래그 이름 (예: --output). base_args에 이미 있으면 검사 자체를 생략
+        self._json_marker = self.json_flag[0] if self.json_flag else None
+        self._json_in_base = self._json_marker in self.base_args
         self.extra_env = extra_env or {}
-
-    async def run(self, *additional_args: str) -> CLIResult:
+        self.max_output_bytes = max_output_bytes
+        self.retry_policy = retry_policy
+        # 실행 중인 조회 명령 → 결과 태스크 (동일 명령 동시 호출 병합)
+        self._inflight: dict[tuple[str, ...], asyncio.Task[CLIResult]] = {}
+        self._env: Optional[dict[str, str]] = None
+        self.refresh_env()
+
+    def refresh_env(self) -> None:
+        """자식 프로세스 환경을 다시 계산합니다 (런타임에 환경 변수가 바뀐 경우 호출).
+
+        extra_env가 없으면 None을 넘겨 부모 환경을 그대로 상속합니다.
+        """
+        self._env = {**os.environ, **self.extra_env} if self.extra_env else None
+
+    async def run(self, *additional_args: str, idempotent: bool = False) -> CLIResult:
+        """CLI를 실행합니다.
+
+        idempotent=True인 조회 명령만 스로틀링/5xx 오류 시 retry_policy에 따라 재시도하며,
+        같은 명령이 이미 실행 중이면 새 프로세스를 띄우지 않고 그 결과를 함께 받습니다.
+        """
         command = [self.binary, *self.base_args, *additional_args]
         self._ensure_json_output(command)
 
-        env = os.environ.copy()
-        env.update(self.extra_env)
+        if not idempotent:
+            return await self._run_once(command)
+
+        key = tuple(command)
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._run_with_retry(command))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        # 한 호출자가 취소되어도 같은 결과를 기다리는 다른 호출자에는 영향이 없도록 shield
+        return await asyncio.shield(task)
+
+    async def _run_with_retry(self, command: List[str]) -> CLIResult:
+        attempts = self.retry_policy.max_attempts
+        for attempt in range(attempts):
+            result = await self._run_once(command)
+            if result.success or attempt == attempts - 1 or not self._is_retryable(result.error):
+                break
+            await asyncio.sleep(self.retry_policy.delay(attempt))
+        return result
 
+    async def _run_once(self, command: List[str]) -> CLIResult:
         process = await asyncio.create_subprocess_exec(
             *command,
             stdout=asyncio.subprocess.PIPE,
             stderr=asyncio.subprocess.PIPE,
-            env=env
+            env=self._env
         )
-        stdout, stderr = await process.communicate()
+        # stderr를 함께 읽어야 파이프가 가득 차 자식 프로세스가 멈추지 않음
+        readers = [
+            asyncio.ensure_future(self._read_bounded(process.stdout)),
+            asyncio.ensure_future(self._read_bounded(process.stderr))
+        ]
+        try:
+            stdout, stderr = await asyncio.gather(*readers)
+        except OutputLimitExceeded as exc:
+            for reader in readers:
+                reader.cancel()
+            process.kill()
+            await process.wait()
+            return CLIResult(success=False, error=str(exc), command=tuple(command))
+        await process.wait()
 
-        result = CLIResult(success=process.returncode == 0, command=" ".join(command))
+        result = CLIResult(success=process.returncode == 0, command=tuple(command))
 
         if result.success:
-            decoded = stdout.decode("utf-8").strip()
-            result.output = self._parse_output(decoded)
+            result.output = self._parse_output(stdout)
         else:
-            result.error = stderr.decode("utf-8").strip() or "Unknown error"
+            result.error = stderr.decode("utf-8", errors="replace").strip() or "Unknown error"
 
         return result
 
+    async def _read_bounded(self, stream: Optional[asyncio.StreamReader]) -> bytearray:
+        """스트림을 청크 단위로 읽되 max_output_bytes를 넘으면 즉시 중단합니다."""
+        buffer = bytearray()
+        if stream is None:
+            return buffer
+        while chunk := await stream.read(_READ_CHUNK_SIZE):
+            buffer += chunk
+            if len(buffer) > self.max_output_bytes:
+                raise OutputLimitExceeded(
+                    f"Output exceeded {self.max_output_bytes} bytes; narrow the query (e.g. lower limit/lines)"
+                )
+        return buffer
+
+    @staticmethod
+    def _is_retryable(error: Optional[str]) -> bool:
+        return bool(error) and _RETRYABLE_ERROR_RE.search(error) is not None
+
     def _ensure_json_output(self, command: List[str]) -> None:
-        if not self.json_flag:
+        if self._json_marker is None or self._json_in_base:
             return
-        # json_flag 전체가 포함되어 있는지 확인
-        if all(flag in command for flag in self.json_flag):
+        # 호출자가 출력 형식 플래그를 직접 지정했다면 그대로 존중
+        if self._json_marker in command:
             return
         command.extend(self.json_flag)
 
     @staticmethod
-    def _parse_output(payload: str) -> Any:
+    def _parse_output(payload: bytes | bytearray) -> Any:
+        # JSON은 디코드 없이 바이트에서 바로 파싱하고, 실패할 때만 문자열로 변환
+        # (앞뒤 공백은 파서가 무시하므로 strip() 복사본을 만들지 않음)
+        if not payload or payload.isspace():
+            return {}
         try:
-            return json.loads(payload) if payload else {}
+            # orjson은 bytearray를 그대로 받으므로 bytes로 복사하지 않음
+            return json_utils.loads(payload)
         except json.JSONDecodeError:
-            return payload
+            return payload.decode("utf-8", errors="replace").strip()
@@ -3,11 +3,33 @@
 from __future__ import annotations
 
 import ast
-from collections import defaultdict
+import asyncio
+import os
+from collections import OrderedDict, defaultdict, deque
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from operator import itemgetter
 from pathlib import Path
-from typing import Any, DefaultDict, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
-from src.utils.file_utils import get_file_extension, list_files_async, read_file_async
+from src.utils.file_utils import list_files_async, read_file_async
+from src.utils.process_pool import pool_context
+
+_FUNCTION_NODES = (ast.FunctionDef, ast.AsyncFunctionDef)
+_TRY_NODES = (ast.Try, getattr(ast, "TryStar", ast.Try))
+# 하위 문 목록을 담는 필드 (ExceptHandler / match_case 본문은 따로 처리)
+_BODY_FIELDS = ("body", "orelse", "finalbody")
+
+# ast.parse/정의 추출을 병렬로 실행하는 워커 프로세스 풀 (처음 사용할 때 생성)
+_PARSE_POOL: Optional[ProcessPoolExecutor] = None
+
+# 이름 색인을 보관할 최대 프로젝트 수
+PROJECT_INDEX_LIMIT = 32
+
+# 파일별 분석 결과 캐시 (절대 경로 → (mtime_ns, size, 결과)), 최근 사용 순 LRU
+# 트리 대신 추출한 imports/functions/classes만 보관해 메모리를 제한
+ANALYSIS_CACHE_SIZE = 1024
+_ANALYSIS_CACHE: "OrderedDict[str, Tuple[int, int, Dict[str, Any]]]" = OrderedDict()
 
 
 class CodeAnalysisService:
@@ -15,6 +37,10 @@ class CodeAnalysisService:
 
     SUPPORTED_EXTENSIONS = [".py", ".go", ".ts", ".tsx", ".js", ".jsx"]
 
+    def __init__(self) -> None:
+        # 프로젝트 경로 → 이름 색인 (find_related_code / get_code_reusability 공용)
+        self._indexes: Dict[str, ProjectIndex] = {}
+
     async def analyze_code_flow(self, project_path: str, entry_point: Optional[str] = None) -> Dict[str, Any]:
         root = Path(project_path)
         result: Dict[str, Any] = {
@@ -34,11 +60,8 @@ class CodeAnalysisService:
                 }
 
         code_files = await list_files_async(project_path, extensions=self.SUPPORTED_EXTENSIONS, recursive=True)
-        for file_path in code_files:
-            if get_file_extension(file_path) != ".py":
-                continue
-
-            analysis = await self._analyze_python_code(file_path)
+        python_files = [file_path for file_path in code_files if file_path.endswith(".py")]
+        for file_path, analysis in zip(python_files, await self._analyze_python_files(python_files)):
             if not analysis["success"]:
                 continue
 
@@ -63,134 +86,254 @@ class CodeAnalysisService:
         target_import: Optional[str] = None
     ) -> Dict[str, Any]:
         code_files = await list_files_async(project_path, extensions=self.SUPPORTED_EXTENSIONS, recursive=True)
-        matches: List[Dict[str, Any]] = []
-
-        for file_path in code_files:
-            if get_file_extension(file_path) != ".py":
-                continue
-
-            analysis = await self._analyze_python_code(file_path)
-            if not analysis["success"]:
-                continue
-
-            matches.extend(self._collect_matches(file_path, analysis, target_function, target_class, target_import))
+        python_files = [file_path for file_path in code_files if file_path.endswith(".py")]
+        index = await self._project_index(project_path, python_files)
 
-        return {"matches": matches, "total_files_scanned": len(code_files)}
+        found: List[Tuple[Tuple[int, int, int], Dict[str, Any]]] = []
+        if target_function:
+            found.extend(index.search(index.functions, target_function))
+        if target_class:
+            found.extend(index.search(index.classes, target_class))
+        if target_import:
+            found.extend(index.search(index.imports, target_import))
+        # 파일 순서 → 종류(함수/클래스/import) → 파일 내 순서로 정렬해 기존 출력 순서를 유지
+        found.sort(key=itemgetter(0))
+        return {"matches": [match for _, match in found], "total_files_scanned": len(code_files)}
 
     async def get_code_reusability(self, project_path: str, language: str = "python") -> Dict[str, Any]:
         if language.lower() != "python":
             return {"common_functions": [], "common_classes": [], "reusable_modules": []}
 
         code_files = await list_files_async(project_path, extensions=[".py"], recursive=True)
-        function_counts = defaultdict(int)
-        class_counts = defaultdict(int)
-
-        for file_path in code_files:
-            analysis = await self._analyze_python_code(file_path)
-            if not analysis["success"]:
-                continue
-            for func in analysis["functions"]:
-                function_counts[func["name"]] += 1
-            for cls in analysis["classes"]:
-                class_counts[cls["name"]] += 1
+        index = await self._project_index(project_path, code_files)
 
         return {
-            "common_functions": self._format_usage_summary(function_counts),
-            "common_classes": self._format_usage_summary(class_counts),
+            "common_functions": self._format_usage_summary(index.counts(index.functions)),
+            "common_classes": self._format_usage_summary(index.counts(index.classes)),
             "reusable_modules": []
         }
 
-    async def _analyze_python_code(self, file_path: str) -> Dict[str, Any]:
-        result: Dict[str, Any] = {
-            "success": False,
-            "imports": [],
-            "functions": [],
-            "classes": [],
-            "error": None
-        }
+    async def _project_index(self, project_path: str, file_paths: List[str]) -> "ProjectIndex":
+        """프로젝트의 이름 색인을 반환합니다 (모든 파일 분석 결과가 캐시 그대로면 재사용)."""
+        analyses = tuple(await self._analyze_python_files(file_paths))
+        index = self._indexes.get(project_path)
+        if index is not None and index.is_current(file_paths, analyses):
+            return index
+        index = ProjectIndex(file_paths, analyses)
+        self._indexes.pop(project_path, None)
+        self._indexes[project_path] = index
+        if len(self._indexes) > PROJECT_INDEX_LIMIT:
+            del self._indexes[next(iter(self._indexes))]
+        return index
+
+    async def _analyze_python_files(self, file_paths: List[str]) -> List[Dict[str, Any]]:
+        """여러 파일을 동시에 분석합니다 (결과는 file_paths 순서 유지)."""
+        return await asyncio.gather(*(self._analyze_python_code(file_path) for file_path in file_paths))
 
+    async def _analyze_python_code(self, file_path: str) -> Dict[str, Any]:
+        """파일을 분석합니다 (수정 시각/크기가 같으면 캐시된 결과를 그대로 반환, 읽기 전용으로 사용)."""
         try:
-            content = await read_file_async(file_path)
-            tree = ast.parse(content, filename=file_path)
-
-            for node in ast.walk(tree):
-                if isinstance(node, ast.Import):
-                    for alias in node.names:
-                        result["imports"].append(alias.name)
-                elif isinstance(node, ast.ImportFrom) and node.module:
-                    result["imports"].append(node.module)
-                elif isinstance(node, ast.FunctionDef):
-                    result["functions"].append(
-                        {
-                            "name": node.name,
-                            "line": node.lineno,
-                            "args": [arg.arg for arg in node.args.args],
-                            "decorators": [self._extract_decorator_name(d) for d in node.decorator_list]
-                        }
-                    )
-                elif isinstance(node, ast.ClassDef):
-                    result["classes"].append(
-                        {
-                            "name": node.name,
-                            "line": node.lineno,
-                            "bases": [self._extract_base_name(base) for base in node.bases],
-                            "methods": [n.name for n in node.body if isinstance(n, ast.FunctionDef)]
-                        }
-                    )
-
-            result["success"] = True
-        except Exception as exc:  # pragma: no cover - AST 파싱 오류 보호
-            result["error"] = str(exc)
+            stat = os.stat(file_path)
+        except OSError as exc:
+            return {"success": False, "imports": [], "functions": [], "classes": [], "error": str(exc)}
+
+        key = os.path.abspath(file_path)
+        cached = _ANALYSIS_CACHE.get(key)
+        if cached is not None and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+            _ANALYSIS_CACHE.move_to_end(key)
+            return cached[2]
+
+        result = await self._parse_python_file(file_path)
+        _ANALYSIS_CACHE[key] = (stat.st_mtime_ns, stat.st_size, result)
+        _ANALYSIS_CACHE.move_to_end(key)
+        if len(_ANALYSIS_CACHE) > ANALYSIS_CACHE_SIZE:
+            _ANALYSIS_CACHE.popitem(last=False)
         return result
 
-    @staticmethod
-    def _collect_matches(
-        file_path: str,
-        analysis: Dict[str, Any],
-        target_function: Optional[str],
-        target_class: Optional[str],
-        target_import: Optional[str]
-    ) -> List[Dict[str, Any]]:
-        matches: List[Dict[str, Any]] = []
-        if target_function:
-            lowered = target_function.lower()
-            for func in analysis["functions"]:
-                if lowered in func["name"].lower():
-                    matches.append({"type": "function", "name": func["name"], "line": func["line"], "file": file_path})
-
-        if target_class:
-            lowered = target_class.lower()
-            for cls in analysis["classes"]:
-                if lowered in cls["name"].lower():
-                    matches.append({"type": "class", "name": cls["name"], "line": cls["line"], "file": file_path})
-
-        if target_import:
-            lowered = target_import.lower()
-            for imp in analysis["imports"]:
-                if lowered in imp.lower():
-                    matches.append({"type": "import", "name": imp, "file": file_path})
-        return matches
-
-    @staticmethod
-    def _extract_decorator_name(node: ast.AST) -> str:
-        if isinstance(node, ast.Name):
-            return node.id
-        if isinstance(node, ast.Attribute):
-            return node.attr
-        return "unknown"
+    async def _parse_python_file(self, file_path: str) -> Dict[str, Any]:
+        try:
+            content = await read_file_async(file_path)
+            # ast.parse는 GIL을 놓지 않으므로 프로세스 풀에서 파싱
+            return await _run_in_parse_pool(_parse_and_extract, file_path, content)
+        except Exception as exc:  # pragma: no cover - 파일 읽기/워커 오류 보호
+            return {"success": False, "imports": [], "functions": [], "classes": [], "error": str(exc)}
 
     @staticmethod
-    def _extract_base_name(node: ast.AST) -> str:
-        if isinstance(node, ast.Name):
-            return node.id
-        if isinstance(node, ast.Attribute):
-            return node.attr
-        return "unknown"
+    def _extract_definitions(tree: ast.Module, result: Dict[str, Any]) -> None:
+        """문(statement) 노드만 따라가며 import/함수/클래스 정의를 모읍니다.
+
+        ast.walk와 달리 표현식 노드(Name, Call 등)는 방문하지 않습니다. 함수/클래스/제어문
+        본문은 계속 따라가므로 지역 import, 중첩 함수, 메서드도 그대로 수집됩니다.
+        """
+        imports = result["imports"]
+        functions = result["functions"]
+        classes = result["classes"]
+        name_node, attribute_node = ast.Name, ast.Attribute
+        pending = deque(tree.body)
+        while pending:
+            node = pending.popleft()
+            node_type = type(node)
+            if node_type is ast.Import:
+                imports.extend(alias.name for alias in node.names)
+                continue
+            if node_type is ast.ImportFrom:
+                if node.module:
+                    imports.append(node.module)
+                continue
+            if node_type in _FUNCTION_NODES:
+                functions.append({
+                    "name": node.name,
+                    "line": node.lineno,
+                    "args": [arg.arg for arg in node.args.args],
+                    # 데코레이터/베이스 이름: Name → id, Attribute → attr (파서가 만드는 노드라 type 비교로 충분)
+                    "decorators": [
+                        d.id if type(d) is name_node else d.attr if type(d) is attribute_node else "unknown"
+                        for d in node.decorator_list
+                    ]
+                })
+            elif node_type is ast.ClassDef:
+                classes.append({
+                    "name": node.name,
+                    "line": node.lineno,
+                    "bases": [
+                        b.id if type(b) is name_node else b.attr if type(b) is attribute_node else "unknown"
+                        for b in node.bases
+                    ],
+                    "methods": [n.name for n in node.body if type(n) in _FUNCTION_NODES]
+                })
+            # 본문을 가진 문(함수/클래스/if/for/while/with/try/match)의 하위 문만 이어서 방문
+            for field in _BODY_FIELDS:
+                children = getattr(node, field, None)
+                if children:
+                    pending.extend(children)
+            if node_type in _TRY_NODES:
+                for handler in node.handlers:
+                    pending.extend(handler.body)
+            elif node_type is ast.Match:
+                for case in node.cases:
+                    pending.extend(case.body)
 
     @staticmethod
-    def _format_usage_summary(counter: DefaultDict[str, int]) -> List[Dict[str, Any]]:
+    def _format_usage_summary(counter: Dict[str, int]) -> List[Dict[str, Any]]:
         return [
             {"name": name, "usage_count": count}
             for name, count in counter.items()
             if count > 1
         ]
+
+
+# 색인 항목: (파일 순번, 종류 순번, 파일 내 순번) 정렬 키와 응답용 매치 dict
+_IndexEntry = Tuple[Tuple[int, int, int], Dict[str, Any]]
+
+
+class ProjectIndex:
+    """프로젝트 전체의 함수/클래스/import 이름 → 위치 역색인.
+
+    부분 문자열 검색은 파일마다가 아니라 고유 이름마다 한 번씩만 비교합니다.
+    """
+
+    __slots__ = ("file_paths", "analyses", "functions", "classes", "imports", "lowered")
+
+    def __init__(self, file_paths: List[str], analyses: Tuple[Dict[str, Any], ...]) -> None:
+        self.file_paths = tuple(file_paths)
+        self.analyses = analyses
+        self.functions: Dict[str, List[_IndexEntry]] = {}
+        self.classes: Dict[str, List[_IndexEntry]] = {}
+        self.imports: Dict[str, List[_IndexEntry]] = {}
+        self.lowered: Dict[str, str] = {}
+
+        for file_index, (file_path, analysis) in enumerate(zip(file_paths, analyses)):
+            if not analysis["success"]:
+                continue
+            for seq, func in enumerate(analysis["functions"]):
+                self._add(self.functions, func["name"], (file_index, 0, seq), {
+                    "type": "function", "name": func["name"], "line": func["line"], "file": file_path
+                })
+            for seq, cls in enumerate(analysis["classes"]):
+                self._add(self.classes, cls["name"], (file_index, 1, seq), {
+                    "type": "class", "name": cls["name"], "line": cls["line"], "file": file_path
+                })
+            for seq, imp in enumerate(analysis["imports"]):
+                self._add(self.imports, imp, (file_index, 2, seq), {"type": "import", "name": imp, "file": file_path})
+
+    def _add(self, table: Dict[str, List[_IndexEntry]], name: str, key: Tuple[int, int, int], match: Dict[str, Any]) -> None:
+        entries = table.get(name)
+        if entries is None:
+            entries = table[name] = []
+            if name not in self.lowered:
+                self.lowered[name] = name.lower()
+        entries.append((key, match))
+
+    def is_current(self, file_paths: List[str], analyses: Tuple[Dict[str, Any], ...]) -> bool:
+        # 분석 캐시는 파일이 그대로면 같은 dict 객체를 돌려주므로 객체 동일성으로 변경 여부를 판단
+        return (
+            self.file_paths == tuple(file_paths)
+            and len(self.analyses) == len(analyses)
+            and all(old is new for old, new in zip(self.analyses, analyses))
+        )
+
+    def search(self, table: Dict[str, List[_IndexEntry]], needle: str) -> List[_IndexEntry]:
+        """이름에 needle이 (대소문자 무시) 포함된 모든 항목을 반환합니다."""
+        lowered = needle.lower()
+        lowered_names = self.lowered
+        found: List[_IndexEntry] = []
+        for name, entries in table.items():
+            if lowered in lowered_names[name]:
+                found.extend(entries)
+        return found
+
+    @staticmethod
+    def counts(table: Dict[str, List[_IndexEntry]]) -> Dict[str, int]:
+        return {name: len(entries) for name, entries in table.items()}
+
+
+def _parse_and_extract(file_path: str, content: str) -> Dict[str, Any]:
+    """소스를 파싱해 정의 목록을 추출합니다 (워커 프로세스에서 실행되는 순수 함수)."""
+    result: Dict[str, Any] = {
+        "success": False,
+        "imports": [],
+        "functions": [],
+        "classes": [],
+        "error": None
+    }
+    try:
+        tree = ast.parse(content, filename=file_path)
+        CodeAnalysisService._extract_definitions(tree, result)
+        result["success"] = True
+    except Exception as exc:  # pragma: no cover - AST 파싱 오류 보호
+        result["error"] = str(exc)
+    return result
+
+
+def _get_parse_pool() -> ProcessPoolExecutor:
+    global _PARSE_POOL
+    if _PARSE_POOL is None:
+        _PARSE_POOL = ProcessPoolExecutor(max_workers=os.cpu_count() or 1, mp_context=pool_context())
+    return _PARSE_POOL
+
+
+def _discard_parse_pool(pool: ProcessPoolExecutor) -> None:
+    global _PARSE_POOL
+    # 동시에 실패한 다른 호출이 이미 새 풀을 만들었으면 그대로 둠
+    if _PARSE_POOL is pool:
+        _PARSE_POOL = None
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+async def _run_in_parse_pool(func: Callable[..., Any], *args: Any) -> Any:
+    """파싱 풀에서 func를 실행하고, 워커가 죽어 풀이 깨졌으면 새 풀로 한 번만 재시도합니다."""
+    loop = asyncio.get_running_loop()
+    pool = _get_parse_pool()
+    try:
+        return await loop.run_in_executor(pool, func, *args)
+    except BrokenProcessPool:
+        _discard_parse_pool(pool)
+        return await loop.run_in_executor(_get_parse_pool(), func, *args)
+
+
+def shutdown_parse_pool() -> None:
+    """AST 파싱 워커 프로세스를 종료합니다."""
+    global _PARSE_POOL
+    if _PARSE_POOL is not None:
+        _PARSE_POOL.shutdown(wait=False, cancel_futures=True)
+        _PARSE_POOL = None
@@ -2,19 +2,32 @@
 
 from __future__ import annotations
 
-from typing import Any, Dict, Optional
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set, Tuple
 
 from src.infrastructure.db.connection_manager import (
+    CREDENTIALS_REFRESH_MARGIN,
+    CREDENTIALS_TTL,
     ConnectionMode,
     DatabaseConnectionManager
 )
+from src.utils.ttl_cache import MISSING, TTLCache
+
+# 재사용할 연결 매니저 수와 유지 시간 (시크릿 교체가 반영되도록 자격 증명 캐시와 같은 주기로 만료)
+MANAGER_CACHE_SIZE = 32
+MANAGER_CACHE_TTL = max(CREDENTIALS_TTL - CREDENTIALS_REFRESH_MARGIN, 1)
+
+ManagerKey = Tuple[Any, ...]
 
 
 class DatabaseService:
     """데이터베이스 접근 서비스."""
     
     def __init__(self) -> None:
-        self._managers: Dict[str, DatabaseConnectionManager] = {}
+        # 연결 설정 → 매니저: 호출마다 자격 증명 조회/연결 문자열 파싱을 반복하지 않도록 재사용
+        self._managers = TTLCache(MANAGER_CACHE_SIZE, MANAGER_CACHE_TTL, on_evict=self._close_later)
+        # 캐시에서 밀려난 매니저의 close() 작업 (완료 전에 GC되지 않도록 보관)
+        self._closing: Set[asyncio.Task[None]] = set()
     
     async def list_databases(
         self,
@@ -28,24 +41,26 @@ class DatabaseService:
         github_repo: Optional[str] = None
     ) -> Dict[str, Any]:
         """데이터베이스 목록을 조회합니다."""
-        manager = DatabaseConnectionManager(
-            db_name=db_name,
-            connection_string=connection_string,
-            mode=ConnectionMode.READ_ONLY,
-            use_dotenv=use_dotenv,
-            use_aws_secrets=use_aws_secrets,
-            aws_secret_name=aws_secret_name,
-            use_github_secrets=use_github_secrets,
-            github_secret_name=github_secret_name,
-            github_repo=github_repo
+        key, manager = self._get_manager(
+            db_name,
+            connection_string,
+            ConnectionMode.READ_ONLY,
+            use_dotenv,
+            use_aws_secrets,
+            aws_secret_name,
+            use_github_secrets,
+            github_secret_name,
+            github_repo
         )
         
         try:
             result = await manager.list_databases()
-            await manager.close()
+            if not result.get("success"):
+                # 매니저는 예외를 잡아 오류 결과로 돌려주므로 오류 메시지로 인증 실패를 판별
+                await self._discard_on_auth_error(key, manager, result.get("error", ""))
             return result
         except Exception as e:
-            await manager.close()
+            await self._discard_on_auth_error(key, manager, e)
             return {
                 "success": False,
                 "error": str(e),
@@ -65,24 +80,26 @@ class DatabaseService:
         github_repo: Optional[str] = None
     ) -> Dict[str, Any]:
         """테이블 스키마를 조회합니다."""
-        manager = DatabaseConnectionManager(
-            db_name=db_name,
-            connection_string=connection_string,
-            mode=ConnectionMode.READ_ONLY,
-            use_dotenv=use_dotenv,
-            use_aws_secrets=use_aws_secrets,
-            aws_secret_name=aws_secret_name,
-            use_github_secrets=use_github_secrets,
-            github_secret_name=github_secret_name,
-            github_repo=github_repo
+        key, manager = self._get_manager(
+            db_name,
+            connection_string,
+            ConnectionMode.READ_ONLY,
+            use_dotenv,
+            use_aws_secrets,
+            aws_secret_name,
+            use_github_secrets,
+            github_secret_name,
+            github_repo
         )
         
         try:
             result = await manager.describe_tables(database=database)
-            await manager.close()
+            if not result.get("success"):
+                # 매니저는 예외를 잡아 오류 결과로 돌려주므로 오류 메시지로 인증 실패를 판별
+                await self._discard_on_auth_error(key, manager, result.get("error", ""))
             return result
         except Exception as e:
-            await manager.close()
+            await self._discard_on_auth_error(key, manager, e)
             return {
                 "success": False,
                 "error": str(e),
@@ -107,27 +124,122 @@ class DatabaseService:
         """쿼리를 실행합니다."""
         connection_mode = ConnectionMode.READ_WRITE if mode == "read_write" else ConnectionMode.READ_ONLY
         
-        manager = DatabaseConnectionManager(
-            db_name=db_name,
-            connection_string=connection_string,
-            mode=connection_mode,
-            use_dotenv=use_dotenv,
-            use_aws_secrets=use_aws_secrets,
-            aws_secret_name=aws_secret_name,
-            use_github_secrets=use_github_secrets,
-            github_secret_name=github_secret_name,
-            github_repo=github_repo
+        key, manager = self._get_manager(
+            db_name,
+            connection_string,
+            connection_mode,
+            use_dotenv,
+            use_aws_secrets,
+            aws_secret_name,
+            use_github_secrets,
+            github_secret_name,
+            github_repo
         )
         
         try:
             result = await manager.execute_query(query, parameters, limit)
-            await manager.close()
+            if not result.get("success"):
+                # 매니저는 예외를 잡아 오류 결과로 돌려주므로 오류 메시지로 인증 실패를 판별
+                await self._discard_on_auth_error(key, manager, result.get("error", ""))
             return result
         except Exception as e:
-            await manager.close()
+            await self._discard_on_auth_error(key, manager, e)
             return {
                 "success": False,
                 "error": str(e),
                 "rows": []
             }
 
+    async def list_databases_many(self, requests: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """여러 연결의 데이터베이스 목록을 동시에 조회합니다 (각 항목은 list_databases 인자)."""
+        return await self._gather_each(self.list_databases, requests, "databases")
+
+    async def describe_many(self, requests: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """여러 연결/데이터베이스의 테이블 스키마를 동시에 조회합니다 (각 항목은 describe_tables 인자)."""
+        return await self._gather_each(self.describe_tables, requests, "tables")
+
+    @staticmethod
+    async def _gather_each(
+        method: Callable[..., Awaitable[Dict[str, Any]]],
+        requests: List[Dict[str, Any]],
+        empty_field: str
+    ) -> Dict[str, Any]:
+        """요청별로 method를 병렬 실행합니다 (같은 연결 설정은 캐시된 매니저/풀을 공유, 결과는 요청 순서)."""
+        async def call(request: Dict[str, Any]) -> Dict[str, Any]:
+            # 잘못된 인자나 지원하지 않는 DB 설정은 해당 항목만 실패로 처리
+            try:
+                return await method(**request)
+            except Exception as e:
+                return {"success": False, "error": str(e), empty_field: []}
+
+        results = await asyncio.gather(*(call(request) for request in requests))
+        return {
+            "success": all(result.get("success") for result in results),
+            "count": len(results),
+            "results": results
+        }
+
+    def _get_manager(
+        self,
+        db_name: Optional[str],
+        connection_string: Optional[str],
+        mode: ConnectionMode,
+        use_dotenv: bool,
+        use_aws_secrets: bool,
+        aws_secret_name: Optional[str],
+        use_github_secrets: bool,
+        github_secret_name: Optional[str],
+        github_repo: Optional[str]
+    ) -> Tuple[ManagerKey, DatabaseConnectionManager]:
+        """같은 연결 설정이면 캐시된 매니저를, 없으면 새로 만들어 반환합니다."""
+        key = (
+            db_name,
+            connection_string,
+            mode,
+            use_dotenv,
+            use_aws_secrets,
+            aws_secret_name,
+            use_github_secrets,
+            github_secret_name,
+            github_repo
+        )
+        manager = self._managers.get(key)
+        if manager is MISSING:
+            # 생성자는 await 없이 끝나므로 이벤트 루프 안에서 같은 키로 중복 생성되지 않음
+            manager = DatabaseConnectionManager(
+                db_name=db_name,
+                connection_string=connection_string,
+                mode=mode,
+                use_dotenv=use_dotenv,
+                use_aws_secrets=use_aws_secrets,
+                aws_secret_name=aws_secret_name,
+                use_github_secrets=use_github_secrets,
+                github_secret_name=github_secret_name,
+                github_repo=github_repo
+            )
+            self._managers.set(key, manager)
+        return key, manager
+
+    async def _discard_on_auth_error(
+        self, key: ManagerKey, manager: DatabaseConnectionManager, error: BaseException | str
+    ) -> None:
+        """인증 오류면 자격 증명과 함께 캐시된 매니저도 닫고 버려 다음 호출에서 다시 구성합니다."""
+        if manager.invalidate_credentials_on_auth_error(error):
+            # 실패한 자격 증명으로 만든 풀이 남지 않도록 닫음 (이미 다른 호출이 버렸으면 생략)
+            if self._managers.pop(key) is manager:
+                await manager.close()
+
+    def _close_later(self, manager: DatabaseConnectionManager) -> None:
+        """만료/용량 초과로 캐시에서 밀려난 매니저를 백그라운드에서 닫습니다."""
+        task = asyncio.get_running_loop().create_task(manager.close())
+        self._closing.add(task)
+        task.add_done_callback(self._closing.discard)
+
+    async def aclose(self) -> None:
+        """캐시된 매니저를 모두 닫습니다 (다른 참조가 없는 엔진 풀은 바로 dispose)."""
+        managers = self._managers.values()
+        self._managers.clear()
+        for manager in managers:
+            await manager.close()
+        if self._closing:
+            await asyncio.gather(*self._closing, return_exceptions=True)
@@ -2,8 +2,9 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Dict, List, Optional
+import sys
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Tuple
 
 from src.tools.docs_parser import ParsedSection
 
@@ -12,6 +13,8 @@ from src.tools.docs_parser import ParsedSection
 class IndexedDoc:
     name: str
     sections: List[ParsedSection]
+    # 섹션별 (소문자 제목, 소문자 본문) - 검색마다 lower()를 반복하지 않도록 추가 시 한 번 계산
+    lowered: List[Tuple[str, str]] = field(default_factory=list, repr=False, compare=False)
 
 
 class DocsIndex:
@@ -21,25 +24,32 @@ class DocsIndex:
         self._docs: Dict[str, IndexedDoc] = {}
 
     def add_document(self, name: str, sections: List[ParsedSection]) -> None:
-        self._docs[name] = IndexedDoc(name=name, sections=sections)
+        name = sys.intern(name)
+        lowered = [(section.title.lower(), section.content.lower()) for section in sections]
+        self._docs[name] = IndexedDoc(name=name, sections=sections, lowered=lowered)
 
     def search(self, keyword: str, limit: int = 5, doc_name: Optional[str] = None) -> Dict[str, any]:
-        keyword_lower = keyword.lower()
         matches: List[Dict[str, str]] = []
-        targets = [doc_name] if doc_name else list(self._docs.keys())
-        for target in targets:
-            doc = self._docs.get(target)
-            if not doc:
-                continue
-            for section in doc.sections:
-                if keyword_lower in section.title.lower() or keyword_lower in section.content.lower():
-                    matches.append(
-                        {
-                            "doc": target,
-                            "title": section.title,
-                            "snippet": section.content[:200] + ("..." if len(section.content) > 200 else ""),
-                        }
-                    )
+        if limit <= 0:
+            return {"matches": matches, "count": 0}
+        keyword_lower = keyword.lower()
+        if doc_name:
+            doc = self._docs.get(doc_name)
+            docs: Iterable[IndexedDoc] = (doc,) if doc else ()
+        else:
+            docs = self._docs.values()
+        for doc in docs:
+            for section, (title_lower, content_lower) in zip(doc.sections, doc.lowered):
+                if keyword_lower not in title_lower and keyword_lower not in content_lower:
+                    continue
+                # 매치된 섹션만 스니펫을 만들고, limit에 도달하면 남은 문서는 보지 않고 바로 반환
+                matches.append(
+                    {
+                        "doc": doc.name,
+                        "title": section.title,
+                        "snippet": section.content[:200] + ("..." if len(section.content) > 200 else ""),
+                    }
+                )
                 if len(matches) >= limit:
                     return {"matches": matches, "count": len(matches)}
         return {"matches": matches, "count": len(matches)}
@@ -3,15 +3,67 @@
 from __future__ import annotations
 
 import re
+import sys
 from dataclasses import dataclass
 from typing import Any, Dict, List, Optional
 
 from bs4 import BeautifulSoup  # type: ignore
 import markdown as md  # type: ignore
 
+try:
+    from selectolax.lexbor import LexborHTMLParser  # type: ignore
+    SELECTOLAX_AVAILABLE = True
+except ImportError:
+    SELECTOLAX_AVAILABLE = False
+
+try:
+    from markdown_it import MarkdownIt  # type: ignore
+    MARKDOWN_IT_AVAILABLE = True
+except ImportError:
+    MARKDOWN_IT_AVAILABLE = False
+
+_HEADING_TAGS = ("h1", "h2", "h3")
+# BeautifulSoup.get_text가 하위 텍스트로 취급하지 않는 태그
+_NON_TEXT_TAGS = ("script", "style", "template")
+# lexbor가 직렬화한 <template ...> 시작 태그 (속성 값은 항상 큰따옴표로 감쌈)
+_TEMPLATE_START_RE = re.compile(r'^<template(?:\s+[^\s=>]+(?:="[^"]*")?)*\s*>')
+
+
+def _node_text(node: Any, separator: str) -> str:
+    """BeautifulSoup의 get_text(separator, strip=True)와 같은 규칙으로 텍스트를 모은다."""
+    if node.tag == "template":
+        # lexbor는 template 내용을 자식이 아닌 별도 DocumentFragment에 두므로 직렬화된 내용을 다시 파싱
+        inner = _TEMPLATE_START_RE.sub("", node.html or "", count=1).removesuffix("</template>")
+        body = LexborHTMLParser(inner).body
+        return _node_text(body, separator) if body is not None else ""
+    parts: List[str] = []
+    for child in node.traverse(include_text=True):
+        if child.tag != "-text":
+            continue
+        parent = child.parent
+        # selectolax는 접근할 때마다 새 래퍼 객체를 돌려주므로 is 대신 mem_id로 같은 노드인지 비교
+        if parent is not None and parent.mem_id != node.mem_id and parent.tag in _NON_TEXT_TAGS:
+            continue
+        text = child.text_content.strip()
+        if text:
+            parts.append(text)
+    return separator.join(parts)
+
+
+def _inline_text(token: Any) -> str:
+    """markdown-it inline 토큰의 텍스트 (서식 기호/HTML/이미지는 제외, 줄바꿈은 유지)."""
+    parts: List[str] = []
+    for child in token.children or ():
+        if child.type in ("text", "code_inline"):
+            parts.append(child.content)
+        elif child.type in ("softbreak", "hardbreak"):
+            parts.append("\n")
+    return "".join(parts).strip()
+
 
 @dataclass(frozen=True, slots=True)
 class ParsedSection:
+    # title은 "Installation", "Usage"처럼 문서마다 반복되므로 파서에서 sys.intern으로 공유
     title: str
     content: str
     code_blocks: List[str]
@@ -21,7 +73,13 @@ class ParsedSection:
 class DocsParser:
     """단순한 HTML/Markdown 파서 (기본 구현)."""
 
+    def __init__(self) -> None:
+        # markdown-it-py가 있으면 HTML을 거치지 않고 토큰에서 바로 섹션을 만듦
+        self._markdown_it = MarkdownIt("commonmark").enable("table") if MARKDOWN_IT_AVAILABLE else None
+
     def parse_html(self, html: str) -> List[ParsedSection]:
+        if SELECTOLAX_AVAILABLE:
+            return self._parse_html_selectolax(html)
         soup = BeautifulSoup(html, "html.parser")
         sections: List[ParsedSection] = []
         for heading in soup.find_all(["h1", "h2", "h3"]):
@@ -47,7 +105,7 @@ class DocsParser:
             if title or content_parts:
                 sections.append(
                     ParsedSection(
-                        title=title or "Untitled",
+                        title=sys.intern(title or "Untitled"),
                         content="\n".join(content_parts),
                         code_blocks=code_blocks,
                         anchors=anchors,
@@ -55,11 +113,110 @@ class DocsParser:
                 )
         return sections
 
+    def _parse_html_selectolax(self, html: str) -> List[ParsedSection]:
+        """selectolax(C 파서)로 parse_html과 같은 결과를 만든다."""
+        tree = LexborHTMLParser(html)
+        sections: List[ParsedSection] = []
+        for heading in tree.css("h1, h2, h3"):
+            title = _node_text(heading, "")
+            content_parts: List[str] = []
+            code_blocks: List[str] = []
+            sibling = heading.next
+            while sibling is not None and sibling.tag not in _HEADING_TAGS:
+                if sibling.tag == "-text":
+                    text = (sibling.text_content or "").strip()
+                else:
+                    text = _node_text(sibling, " ")
+                if text:
+                    content_parts.append(text)
+                if sibling.tag == "pre":
+                    code_text = _node_text(sibling, "\n")
+                    if code_text:
+                        code_blocks.append(code_text)
+                sibling = sibling.next
+            if title or content_parts:
+                sections.append(
+                    ParsedSection(
+                        title=sys.intern(title or "Untitled"),
+                        content="\n".join(content_parts),
+                        code_blocks=code_blocks,
+                        anchors=[],
+                    )
+                )
+        return sections
+
     def parse_markdown(self, markdown_text: str) -> List[ParsedSection]:
+        if self._markdown_it is not None:
+            sections = self._parse_markdown_tokens(markdown_text)
+            if sections is not None:
+                return sections
         # Convert markdown to HTML then reuse html parser
         html = md.markdown(markdown_text)
         return self.parse_html(html)
 
+    def _parse_markdown_tokens(self, markdown_text: str) -> Optional[List[ParsedSection]]:
+        """markdown-it 토큰을 순회하며 parse_html과 같은 규칙으로 섹션을 만든다.
+
+        최상위 h1~h3가 섹션을 시작하고, 최상위 블록 하나가 본문 한 줄이 되며,
+        최상위 코드 블록은 code_blocks에도 담는다. 원시 HTML이 있으면 None을 반환해
+        HTML 변환 경로를 쓰게 한다 (<details> 등 블록 구조가 HTML 파서와 달라짐).
+        """
+        sections: List[ParsedSection] = []
+        title: Optional[str] = None  # 첫 헤딩 전에는 None
+        content_parts: List[str] = []
+        code_blocks: List[str] = []
+        block_parts: List[str] = []
+        in_heading = False
+
+        def flush() -> None:
+            if title or content_parts:
+                sections.append(
+                    ParsedSection(
+                        title=sys.intern(title or "Untitled"),
+                        content="\n".join(content_parts),
+                        code_blocks=code_blocks,
+                        anchors=[],
+                    )
+                )
+
+        for token in self._markdown_it.parse(markdown_text):
+            kind = token.type
+            if kind == "html_block" or (
+                kind == "inline" and any(child.type == "html_inline" for child in token.children or ())
+            ):
+                return None
+            if in_heading:
+                if kind == "inline":
+                    title = _inline_text(token)
+                elif kind == "heading_close":
+                    in_heading = False
+                continue
+            if kind == "heading_open" and token.level == 0 and token.tag in _HEADING_TAGS:
+                if title is not None:
+                    flush()
+                title, content_parts, code_blocks = "", [], []
+                in_heading = True
+                continue
+            if title is None:
+                continue
+            if kind == "inline":
+                text = _inline_text(token)
+                if text:
+                    block_parts.append(text)
+            elif kind in ("fence", "code_block"):
+                code = token.content.strip()
+                if code:
+                    block_parts.append(code)
+                    if token.level == 0:
+                        code_blocks.append(code)
+            # 최상위 블록이 끝나면(닫는 토큰 또는 단독 블록) 본문 한 줄로 모음
+            if token.level == 0 and token.nesting != 1 and block_parts:
+                content_parts.append(" ".join(block_parts))
+                block_parts = []
+        if title is not None:
+            flush()
+        return sections
+
 
-__all__ = ["DocsParser", "ParsedSection"]
+__all__ = ["DocsParser", "ParsedSection", "MARKDOWN_IT_AVAILABLE", "SELECTOLAX_AVAILABLE"]
 
@@ -2,14 +2,23 @@
 
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional
-
+import os
+import sys
+import threading
 from pathlib import Path
+from stat import S_ISREG
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 from src.tools.docs_registry import LibraryMeta, registry
-from src.tools.docs_parser import DocsParser
+from src.tools.docs_parser import MARKDOWN_IT_AVAILABLE, SELECTOLAX_AVAILABLE, DocsParser, ParsedSection
 from src.tools.docs_index import DocsIndex
 from src.tools.official_docs import DOCUMENT_EXTENSIONS, OfficialDocsService
+from src.utils import json_utils
+
+# 파싱 결과 디스크 캐시 (docs/.cache 아래, 프로세스 재시작 후에도 바뀐 파일만 다시 파싱)
+PARSE_CACHE_FILENAME = "docs_parse_cache.json"
+# 형식이나 파서 구현이 바뀌면 이전 캐시를 버리도록 헤더에 기록
+_PARSE_CACHE_FINGERPRINT = [1, MARKDOWN_IT_AVAILABLE, SELECTOLAX_AVAILABLE]
 
 
 class DocsService:
@@ -19,7 +28,14 @@ class DocsService:
         self._registry = registry
         self._official = OfficialDocsService()
         self._parser = DocsParser()
-        self._structured_index = DocsIndex()
+        # (mirror_dir, name) -> (파일 시그니처, 인덱스): 파일 목록/수정 시각이 같으면 인덱스 재사용
+        self._structured_indexes: Dict[Tuple[str, Optional[str]], Tuple[Tuple[Any, ...], DocsIndex]] = {}
+        # 파일 경로 -> (mtime_ns, size, 파싱 결과)
+        self._parse_cache: Dict[str, Tuple[int, int, List[ParsedSection]]] = {}
+        self._parse_cache_loaded = False
+        # 마지막 저장 이후 새로 파싱한 파일이 있는지
+        self._parse_cache_dirty = False
+        self._parse_cache_lock = threading.Lock()
 
     # Registry helpers
     def resolve_library_id(self, name: str) -> Dict[str, Any]:
@@ -75,45 +91,117 @@ class DocsService:
 
     # Internal helpers
     def _get_by_id(self, library_id: str) -> Optional[LibraryMeta]:
-        for meta in self._registry.list_all():
-            if meta.id == library_id:
-                return meta
-        return None
+        return self._registry.resolve_by_id(library_id)
 
     def _structured_search(self, keyword: str, name: Optional[str], limit: int) -> Dict[str, Any]:
         mirror_dir = self._official.mirror_dir  # type: ignore[attr-defined]
-        targets: List[Path] = []
-        if name:
-            for candidate in mirror_dir.glob(f"{name}/**"):
-                if candidate.is_dir():
-                    targets.append(candidate)
-        else:
-            for candidate in mirror_dir.glob("**"):
-                if candidate.is_dir():
-                    targets.append(candidate)
-
-        # 인덱스 초기화
-        self._structured_index = DocsIndex()
-
-        for target in targets:
-            doc_name = target.relative_to(mirror_dir).as_posix()
-            for file_path in target.rglob("*"):
-                if not file_path.is_file():
-                    continue
-                if file_path.suffix.lower() not in DOCUMENT_EXTENSIONS:
+        search_root = mirror_dir / name if name else mirror_dir
+        cache_path = mirror_dir.parent / ".cache" / PARSE_CACHE_FILENAME
+        with self._parse_cache_lock:
+            # 동시에 들어온 다른 검색은 첫 로드가 끝날 때까지 대기
+            if not self._parse_cache_loaded:
+                self._load_parse_cache(cache_path)
+                self._parse_cache_loaded = True
+
+        # 미러를 한 번만 순회하며 문서 확장자 파일만 stat (문서 이름은 name 또는 최상위 디렉토리)
+        files: List[Tuple[str, str, int, int]] = []
+        for dir_path, _, file_names in os.walk(search_root):
+            doc_name = sys.intern(name or os.path.relpath(dir_path, mirror_dir).split(os.sep, 1)[0])
+            for file_name in file_names:
+                if os.path.splitext(file_name)[1].lower() not in DOCUMENT_EXTENSIONS:
                     continue
+                file_path = os.path.join(dir_path, file_name)
                 try:
-                    text = file_path.read_text(encoding="utf-8", errors="ignore")
-                except Exception:
+                    stat_result = os.stat(file_path)
+                except OSError:
                     continue
-                if file_path.suffix.lower() in {".md", ".mdx"}:
-                    sections = self._parser.parse_markdown(text)
-                else:
-                    sections = self._parser.parse_html(text)
-                if sections:
-                    self._structured_index.add_document(doc_name, sections)
+                if not S_ISREG(stat_result.st_mode):
+                    continue
+                files.append((doc_name, file_path, stat_result.st_mtime_ns, stat_result.st_size))
 
-        return self._structured_index.search(keyword, limit=limit, doc_name=name)
+        signature = tuple(files)
+        cache_key = (str(mirror_dir), name)
+        cached = self._structured_indexes.get(cache_key)
+        if cached is not None and cached[0] == signature:
+            index = cached[1]
+        else:
+            grouped: Dict[str, List[ParsedSection]] = {}
+            for doc_name, file_path, mtime_ns, size in files:
+                sections = self._parse_file(file_path, mtime_ns, size)
+                if sections:
+                    grouped.setdefault(doc_name, []).extend(sections)
+            index = DocsIndex()
+            for doc_name, sections in grouped.items():
+                index.add_document(doc_name, sections)
+            self._structured_indexes[cache_key] = (signature, index)
+            if self._parse_cache_dirty:
+                # 전체 미러를 순회한 경우에만 사라진 파일의 항목을 정리
+                self._save_parse_cache(cache_path, None if name else {file_path for _, file_path, _, _ in files})
+
+        return index.search(keyword, limit=limit, doc_name=name)
+
+    def _parse_file(self, file_path: str, mtime_ns: int, size: int) -> List[ParsedSection]:
+        """파일을 파싱합니다. 수정 시각과 크기가 같으면 이전 결과를 재사용합니다."""
+        cached = self._parse_cache.get(file_path)
+        if cached is not None and cached[0] == mtime_ns and cached[1] == size:
+            return cached[2]
+        try:
+            with open(file_path, "r", encoding="utf-8", errors="ignore") as file_handle:
+                text = file_handle.read()
+        except Exception:
+            return []
+        if os.path.splitext(file_path)[1].lower() in {".md", ".mdx"}:
+            sections = self._parser.parse_markdown(text)
+        else:
+            sections = self._parser.parse_html(text)
+        with self._parse_cache_lock:
+            self._parse_cache[file_path] = (mtime_ns, size, sections)
+            self._parse_cache_dirty = True
+        return sections
+
+    def _load_parse_cache(self, cache_path: Path) -> None:
+        """디스크에 저장된 파싱 결과를 불러옵니다 (없거나 형식이 다르면 무시, _parse_cache_lock을 잡고 호출)."""
+        try:
+            with open(cache_path, "rb") as file_handle:
+                payload = json_utils.loads(file_handle.read())
+            if payload.get("fingerprint") != _PARSE_CACHE_FINGERPRINT:
+                return
+            for file_path, (mtime_ns, size, sections) in payload["files"].items():
+                self._parse_cache.setdefault(
+                    file_path,
+                    (mtime_ns, size, [
+                        ParsedSection(sys.intern(title), content, code_blocks, anchors)
+                        for title, content, code_blocks, anchors in sections
+                    ])
+                )
+        except Exception:
+            return
+
+    def _save_parse_cache(self, cache_path: Path, keep: Optional[Set[str]]) -> None:
+        """파싱 결과를 디스크에 저장합니다 (임시 파일에 쓴 뒤 교체, keep이 있으면 그 경로만 유지)."""
+        with self._parse_cache_lock:
+            self._parse_cache_dirty = False
+            if keep is not None:
+                # 다른 스레드가 같은 딕셔너리를 참조하므로 교체하지 않고 제자리에서 삭제
+                for file_path in [file_path for file_path in self._parse_cache if file_path not in keep]:
+                    del self._parse_cache[file_path]
+            entries = list(self._parse_cache.items())
+            files = {
+                file_path: [
+                    mtime_ns,
+                    size,
+                    [[section.title, section.content, section.code_blocks, section.anchors] for section in sections]
+                ]
+                for file_path, (mtime_ns, size, sections) in entries
+            }
+            temp_path = cache_path.with_name(cache_path.name + ".tmp")
+            try:
+                cache_path.parent.mkdir(parents=True, exist_ok=True)
+                with open(temp_path, "wb") as file_handle:
+                    file_handle.write(json_utils.dumps_bytes({"fingerprint": _PARSE_CACHE_FINGERPRINT, "files": files}))
+                os.replace(temp_path, cache_path)
+            except OSError:
+                return
 
     @staticmethod
     def _meta_to_dict(meta: LibraryMeta) -> Dict[str, Any]:
@@ -2,12 +2,70 @@
 
 from __future__ import annotations
 
+import asyncio
 import os
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
+from src.utils.env_settings import env_int
 from src.utils.file_utils import list_files_async, read_file_async
 
+# 검색 시 파일을 한 번에 읽지 않고 이 크기(문자 수)씩 나눠 읽음
+SEARCH_CHUNK_CHARS = 64 * 1024
+PREVIEW_CHARS = 200
+# 동시에 진행할 파일 검색/디렉토리 순회 수 (GARY_MCP_READ_CONCURRENCY)
+READ_CONCURRENCY = env_int("GARY_MCP_READ_CONCURRENCY", 64, minimum=1)
+
+
+def _has_border(query: str) -> bool:
+    """검색어의 접두사와 접미사가 겹치는지 확인합니다 (겹치면 등장 위치끼리 겹칠 수 있음)."""
+    return any(query[:size] == query[-size:] for size in range(1, len(query)))
+
+
+def _scan_file(file_path: str, lowered_query: str) -> Optional[Tuple[int, str]]:
+    """파일을 청크 단위로 읽으며 검색어 등장 횟수를 셉니다 (없으면 None).
+
+    메모리에는 청크 하나와 경계에 걸친 검색어를 잇기 위한 꼬리만 유지합니다.
+    횟수는 str.count와 같이 겹치지 않는 등장만 셉니다.
+    """
+    query_length = len(lowered_query)
+    # 등장끼리 겹칠 수 없는 검색어는 매치마다 find를 반복하지 않고 str.count로 한 번에 셈
+    count_at_once = not _has_border(lowered_query)
+    matches = 0
+    preview = ""
+    carry = ""
+    with open(file_path, "r", encoding="utf-8") as file_handle:
+        while chunk := file_handle.read(SEARCH_CHUNK_CHARS):
+            if len(preview) <= PREVIEW_CHARS:
+                # 미리보기용으로 첫 200자 + 뒤에 내용이 더 있는지 판단할 한 글자만 보관
+                preview = (preview + chunk)[:PREVIEW_CHARS + 1]
+            if not query_length:
+                # 빈 검색어는 str.count처럼 (문자 수 + 1)번 등장한 것으로 취급
+                matches += len(chunk)
+                continue
+            buffer = carry + chunk.lower()
+            next_start = 0
+            if count_at_once:
+                found = buffer.count(lowered_query)
+                if found:
+                    matches += found
+                    next_start = buffer.rfind(lowered_query) + query_length
+            else:
+                position = buffer.find(lowered_query)
+                while position != -1:
+                    matches += 1
+                    next_start = position + query_length
+                    position = buffer.find(lowered_query, next_start)
+            # 다음 청크와 이어질 수 있는 꼬리 (직전 매치와 겹치는 부분은 제외)
+            carry = buffer[max(next_start, len(buffer) - query_length + 1):]
+    if not query_length:
+        matches += 1
+    if not matches:
+        return None
+    if len(preview) > PREVIEW_CHARS:
+        preview = preview[:PREVIEW_CHARS] + "..."
+    return matches, preview
+
 
 class DocumentService:
     """워크스페이스 문서를 인덱싱하고 조회하는 서비스."""
@@ -27,10 +85,23 @@ class DocumentService:
         if not self.workspace_path.exists():
             return projects
 
-        for item in self.workspace_path.iterdir():
-            if not item.is_dir() or item.name.startswith("."):
-                continue
-
+        project_dirs = [
+            item for item in self.workspace_path.iterdir()
+            if item.is_dir() and not item.name.startswith(".")
+        ]
+        semaphore = asyncio.Semaphore(READ_CONCURRENCY)
+
+        async def list_markdown(project_dir: Path) -> List[str]:
+            async with semaphore:
+                return await list_files_async(
+                    str(project_dir),
+                    extensions=[".md", ".markdown"],
+                    recursive=True
+                )
+
+        # 프로젝트별 디렉토리 순회를 동시에 진행 (결과는 iterdir 순서 유지)
+        md_files_per_project = await asyncio.gather(*(list_markdown(item) for item in project_dirs))
+        for item, md_files in zip(project_dirs, md_files_per_project):
             project_info: Dict[str, Any] = {
                 "name": item.name,
                 "path": str(item),
@@ -39,11 +110,6 @@ class DocumentService:
             }
 
             self._attach_readme_files(item, project_info)
-            md_files = await list_files_async(
-                str(item),
-                extensions=[".md", ".markdown"],
-                recursive=True
-            )
             project_info["document_files"].extend(md_files[: self.max_documents])
             projects.append(project_info)
 
@@ -80,21 +146,27 @@ class DocumentService:
         )
 
         lowered_query = query.lower()
-        results: List[Dict[str, Any]] = []
-        for file_path in md_files:
-            try:
-                content = await read_file_async(file_path)
-            except Exception:
-                continue
+        semaphore = asyncio.Semaphore(READ_CONCURRENCY)
 
-            if lowered_query not in content.lower():
+        async def scan(file_path: str) -> Optional[Tuple[int, str]]:
+            async with semaphore:
+                try:
+                    return await asyncio.to_thread(_scan_file, file_path, lowered_query)
+                except Exception:
+                    return None
+
+        # 파일 검색을 동시에 진행하고 결과는 파일 목록 순서대로 모음
+        scanned = await asyncio.gather(*(scan(file_path) for file_path in md_files))
+        results: List[Dict[str, Any]] = []
+        for file_path, found in zip(md_files, scanned):
+            if found is None:
                 continue
 
-            preview = content[:200] + "..." if len(content) > 200 else content
+            matches, preview = found
             results.append(
                 {
                     "file_path": file_path,
-                    "matches": content.lower().count(lowered_query),
+                    "matches": matches,
                     "preview": preview
                 }
             )
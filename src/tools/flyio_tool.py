@@ -31,6 +31,7 @@ class FlyioService:
         return await self._execute("machines", ["list", "-a", app_name])
 
     async def _execute(self, command: str, args: Optional[Sequence[str]] = None) -> Dict[str, object]:
+        # 이 서비스의 명령은 모두 조회용이므로 일시적 오류 시 재시도 허용
         args = args or []
-        result = await self.cli.run(command, *args)
+        result = await self.cli.run(command, *args, idempotent=True)
         return result.to_dict()
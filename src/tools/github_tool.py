@@ -2,11 +2,62 @@
 
 from __future__ import annotations
 
+import asyncio
+import os
 from typing import Any, Dict, List, Optional
 
-from src.tools.cli_executor import CLIService
+import aiohttp
+
+from src.tools.cli_executor import CLIResult, CLIService
+from src.utils import json_utils
 from src.utils.env_loader import load_shell_env
 
+# REST API 한 페이지 최대 크기 (이보다 큰 limit은 gh CLI의 페이지네이션에 맡김)
+_API_MAX_PER_PAGE = 100
+_API_HEADERS = {
+    "Accept": "application/vnd.github+json",
+    "X-GitHub-Api-Version": "2022-11-28",
+}
+_API_TIMEOUT = aiohttp.ClientTimeout(total=30)
+
+
+def _author(item: Dict[str, Any]) -> Dict[str, Any]:
+    # gh의 author 중 REST 목록 응답으로 채울 수 있는 필드만 변환 (name은 제공되지 않음)
+    user = item.get("user") or {}
+    return {
+        "id": user.get("node_id", ""),
+        "is_bot": user.get("type") == "Bot",
+        "login": user.get("login", ""),
+    }
+
+
+def _repo_fields(repo: Dict[str, Any]) -> Dict[str, Any]:
+    # gh repo list --json nameWithOwner,description,visibility,updatedAt 형태로 변환
+    return {
+        "nameWithOwner": repo.get("full_name"),
+        "description": repo.get("description") or "",
+        "visibility": (repo.get("visibility") or "").upper(),
+        "updatedAt": repo.get("updated_at"),
+    }
+
+
+def _issue_fields(issue: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "number": issue.get("number"),
+        "title": issue.get("title"),
+        "author": _author(issue),
+        "updatedAt": issue.get("updated_at"),
+        "labels": [
+            {
+                "id": label.get("node_id"),
+                "name": label.get("name"),
+                "description": label.get("description") or "",
+                "color": label.get("color"),
+            }
+            for label in issue.get("labels") or ()
+        ],
+    }
+
 
 class GitHubService:
     """Service to interact with GitHub CLI."""
@@ -17,11 +68,74 @@ class GitHubService:
             keys=("GITHUB_TOKEN", "GH_TOKEN", "GITHUB_HOST", "GH_HOST")
         )
         self.cli = CLIService("gh", extra_env=extra_env)
+        self._host = extra_env.get("GH_HOST") or os.getenv("GH_HOST") or "github.com"
+        self._api_base = (
+            "https://api.github.com" if self._host == "github.com" else f"https://{self._host}/api/v3"
+        )
+        # None: 아직 조회 전이거나 토큰이 무효화됨 (다음 호출에서 `gh auth token`으로 다시 조회)
+        self._token: Optional[str] = (
+            extra_env.get("GH_TOKEN") or extra_env.get("GITHUB_TOKEN")
+            or os.getenv("GH_TOKEN") or os.getenv("GITHUB_TOKEN")
+        )
+        self._token_lock = asyncio.Lock()
+        self._session: Optional[aiohttp.ClientSession] = None
 
-    async def execute(self, args: List[str]) -> Dict[str, Any]:
-        result = await self.cli.run(*args)
+    async def execute(self, args: List[str], idempotent: bool = False) -> Dict[str, Any]:
+        result = await self.cli.run(*args, idempotent=idempotent)
         return result.to_dict()
 
+    async def close(self) -> None:
+        """REST API용 HTTP 세션을 닫습니다."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    async def _get_token(self) -> str:
+        # `gh auth token`은 성공한 토큰만 캐시 (실패 시 다음 호출에서 다시 시도)
+        if self._token:
+            return self._token
+        async with self._token_lock:
+            if not self._token:
+                result = await self.cli.run("auth", "token", "--hostname", self._host, idempotent=True)
+                output = result.output if result.success else ""
+                token = output.strip() if isinstance(output, str) else ""
+                self._token = token or None
+        return self._token or ""
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """keep-alive 연결을 재사용하는 REST API 세션을 반환합니다."""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                headers=_API_HEADERS,
+                timeout=_API_TIMEOUT,
+                connector=aiohttp.TCPConnector(limit=20, keepalive_timeout=60, ttl_dns_cache=300),
+            )
+        return self._session
+
+    async def _api_get(self, path: str, params: Dict[str, Any]) -> Optional[Any]:
+        """GitHub REST API GET 요청 (실패 시 None을 반환해 gh CLI로 폴백)."""
+        token = await self._get_token()
+        if not token:
+            return None
+        try:
+            async with self._get_session().get(
+                self._api_base + path,
+                params=params,
+                headers={"Authorization": f"Bearer {token}"},
+            ) as response:
+                if response.status == 401 and self._token == token:
+                    # 만료/폐기된 토큰은 버리고 다음 호출에서 다시 받아옴
+                    self._token = None
+                if response.status != 200:
+                    return None
+                return await response.json(loads=json_utils.loads)
+        except (aiohttp.ClientError, asyncio.TimeoutError, ValueError):
+            return None
+
+    @staticmethod
+    def _api_result(path: str, output: Any) -> Dict[str, Any]:
+        return CLIResult(success=True, output=output, command=("GET", path)).to_dict()
+
     async def list_repos(
         self,
         owner: Optional[str] = None,
@@ -29,6 +143,21 @@ class GitHubService:
         limit: int = 20,
         sort: str = "updated"
     ) -> Dict[str, Any]:
+        if owner is None and visibility in (None, "public", "private") and limit <= _API_MAX_PER_PAGE:
+            # 인증 사용자 본인 소유 레포는 REST API 한 번으로 조회 (정렬도 서버에서 처리)
+            path = "/user/repos"
+            params: Dict[str, Any] = {
+                "affiliation": "owner",
+                "per_page": limit,
+                "sort": "full_name" if sort == "name" else sort if sort in ("created", "pushed") else "updated",
+                "direction": "asc" if sort == "name" else "desc",
+            }
+            if visibility:
+                params["visibility"] = visibility
+            repos = await self._api_get(path, params)
+            if isinstance(repos, list):
+                return self._api_result(path, [_repo_fields(repo) for repo in repos])
+
         # GitHub CLI는 --sort 플래그를 지원하지 않으므로 limit을 늘려서 받고 Python에서 정렬
         fetch_limit = limit * 2 if limit > 10 else 50  # 정렬을 위해 더 많이 가져옴
         
@@ -45,11 +174,12 @@ class GitHubService:
         if visibility:
             args.extend(["--visibility", visibility])
         
-        result = await self.execute(args)
+        result = await self.execute(args, idempotent=True)
         
         # Python에서 정렬
         if isinstance(result.get("output"), list):
-            repos = result["output"]
+            # 동시 호출과 공유되는 CLI 결과이므로 원본 리스트를 직접 정렬하지 않음
+            repos = list(result["output"])
             reverse = sort in ("updated", "created", "pushed")
             if sort == "updated":
                 repos.sort(key=lambda x: x.get("updatedAt", ""), reverse=reverse)
@@ -66,6 +196,7 @@ class GitHubService:
         state: str = "open",
         limit: int = 20
     ) -> Dict[str, Any]:
+        # 목록 REST API는 mergeable을 계산하지 않으므로 PR 목록은 gh CLI로 조회
         args = [
             "pr",
             "list",
@@ -78,7 +209,7 @@ class GitHubService:
             "--json",
             "number,title,author,updatedAt,headRefName,baseRefName,mergeable"
         ]
-        return await self.execute(args)
+        return await self.execute(args, idempotent=True)
 
     async def list_issues(
         self,
@@ -86,6 +217,16 @@ class GitHubService:
         state: str = "open",
         limit: int = 20
     ) -> Dict[str, Any]:
+        if state in ("open", "closed", "all") and limit <= _API_MAX_PER_PAGE:
+            # issues API는 PR도 함께 반환하므로 한 페이지를 가득 받아 걸러냄
+            path = f"/repos/{repo}/issues"
+            items = await self._api_get(path, {"state": state, "per_page": _API_MAX_PER_PAGE})
+            if isinstance(items, list):
+                issues = [item for item in items if "pull_request" not in item]
+                # 걸러낸 뒤 limit에 못 미치는데 다음 페이지가 있을 수 있으면 gh CLI에 맡김
+                if len(issues) >= limit or len(items) < _API_MAX_PER_PAGE:
+                    return self._api_result(path, [_issue_fields(issue) for issue in issues[:limit]])
+
         args = [
             "issue",
             "list",
@@ -98,4 +239,4 @@ class GitHubService:
             "--json",
             "number,title,author,updatedAt,labels"
         ]
-        return await self.execute(args)
+        return await self.execute(args, idempotent=True)
@@ -55,7 +55,9 @@ class MCPProxyService:
                     url=config_dict.get("url"),
                     env=config_dict.get("env"),
                     cwd=config_dict.get("cwd"),
-                    namespace_prefix=config_dict.get("namespace_prefix", "")
+                    namespace_prefix=config_dict.get("namespace_prefix", ""),
+                    tools_ttl=config_dict.get("tools_ttl", 30.0),
+                    tool_timeout=config_dict.get("tool_timeout", 60.0)
                 )
                 self.manager.register_proxy(config)
             except Exception as e:
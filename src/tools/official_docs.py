@@ -10,6 +10,8 @@ import subprocess
 import sys
 import tarfile
 import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
@@ -23,6 +25,8 @@ requests = import_module("requests")
 yaml = import_module("yaml")
 
 DOCUMENT_EXTENSIONS = {".md", ".mdx", ".rst", ".txt", ".html", ".htm"}
+# 동기화 시 네트워크 대기를 겹치기 위한 최대 워커 수
+SYNC_MAX_WORKERS = 16
 
 
 @dataclass
@@ -63,6 +67,16 @@ class OfficialDocsService:
         self.metadata_name = "metadata.json"
         self.sources_dir.mkdir(parents=True, exist_ok=True)
         self.mirror_dir.mkdir(parents=True, exist_ok=True)
+        # requests.Session은 스레드 안전하지 않으므로 동기화 워커 스레드마다 따로 둠
+        self._http_local = threading.local()
+
+    @property
+    def http_session(self) -> Any:
+        """현재 스레드의 HTTP 세션 (같은 워커가 이어서 받는 요청은 keep-alive 연결을 재사용)."""
+        session = getattr(self._http_local, "session", None)
+        if session is None:
+            session = self._http_local.session = requests.Session()
+        return session
 
     def load_manifest(self) -> List[DocEntry]:
         if not self.manifest_path.exists():
@@ -92,26 +106,14 @@ class OfficialDocsService:
         return entries
 
     def sync_docs(self, names: Optional[List[str]] = None, force: bool = False) -> Dict[str, Any]:
-        entries = self.load_manifest()
-        results = []
-        overall_success = True
-
-        for entry in entries:
-            if names and entry.name not in names:
-                continue
-            try:
-                if entry.type == "git":
-                    self._sync_git_entry(entry, force)
-                elif entry.type == "archive":
-                    self._sync_archive_entry(entry, force)
-                elif entry.type == "http":
-                    self._sync_http_entry(entry, force)
-                else:
-                    raise ValueError(f"Unsupported entry type: {entry.type}")
-                results.append({"name": entry.name, "success": True})
-            except Exception as exc:  # pragma: no cover - runtime issues logged to caller
-                overall_success = False
-                results.append({"name": entry.name, "success": False, "error": str(exc)})
+        entries = [entry for entry in self.load_manifest() if not names or entry.name in names]
+        if not entries:
+            return {"success": True, "results": []}
+
+        # 항목별 동기화는 서로 독립적이므로 스레드 풀에서 동시에 실행
+        with ThreadPoolExecutor(max_workers=min(SYNC_MAX_WORKERS, len(entries))) as executor:
+            results = list(executor.map(lambda entry: self._sync_entry(entry, force), entries))
+        overall_success = all(result["success"] for result in results)
         return {"success": overall_success, "results": results}
 
     def list_docs(self) -> Dict[str, Any]:
@@ -151,6 +153,20 @@ class OfficialDocsService:
 
     # Internal helpers
 
+    def _sync_entry(self, entry: DocEntry, force: bool) -> Dict[str, Any]:
+        try:
+            if entry.type == "git":
+                self._sync_git_entry(entry, force)
+            elif entry.type == "archive":
+                self._sync_archive_entry(entry, force)
+            elif entry.type == "http":
+                self._sync_http_entry(entry, force)
+            else:
+                raise ValueError(f"Unsupported entry type: {entry.type}")
+            return {"name": entry.name, "success": True}
+        except Exception as exc:  # pragma: no cover - runtime issues logged to caller
+            return {"name": entry.name, "success": False, "error": str(exc)}
+
     def _sync_git_entry(self, entry: DocEntry, force: bool) -> None:
         if not entry.repo or not entry.ref:
             raise ValueError(f"Git entry {entry.name} missing repo/ref")
@@ -214,13 +230,22 @@ class OfficialDocsService:
             shutil.rmtree(target_dir)
         target_dir.mkdir(parents=True, exist_ok=True)
 
-        for page in pages:
-            relative_path = self._sanitize_relative_path(page.path or self._derive_http_relative_path(page.url))
+        downloads = [
+            (page, target_dir / self._sanitize_relative_path(page.path or self._derive_http_relative_path(page.url)))
+            for page in pages
+        ]
+        # 상위 디렉토리는 중복 없이 한 번씩만 생성
+        for parent in {destination.parent for _, destination in downloads}:
+            parent.mkdir(parents=True, exist_ok=True)
+
+        def _download(item: tuple[HttpPage, Path]) -> None:
+            page, destination = item
             content = self._fetch_http_content(page.url, entry.http_headers, entry.http_timeout)
-            destination = target_dir / relative_path
-            destination.parent.mkdir(parents=True, exist_ok=True)
             destination.write_text(content, encoding="utf-8")
 
+        with ThreadPoolExecutor(max_workers=min(SYNC_MAX_WORKERS, len(downloads))) as executor:
+            list(executor.map(_download, downloads))
+
         self._write_metadata(entry, target_dir, extra={"http_pages": len(pages)})
 
     def _download_file(self, url: str, destination: Path) -> None:
@@ -228,7 +253,7 @@ class OfficialDocsService:
             source_path = Path(url[7:])
             shutil.copy(source_path, destination)
             return
-        response = requests.get(url, stream=True, timeout=60)
+        response = self.http_session.get(url, stream=True, timeout=60)
         response.raise_for_status()
         with destination.open("wb") as f:
             for chunk in response.iter_content(chunk_size=8192):
@@ -340,7 +365,7 @@ class OfficialDocsService:
         if url.startswith("file://"):
             source_path = Path(url[7:])
             return source_path.read_text(encoding="utf-8")
-        response = requests.get(url, headers=headers or {}, timeout=timeout)
+        response = self.http_session.get(url, headers=headers or {}, timeout=timeout)
         response.raise_for_status()
         response.encoding = response.encoding or "utf-8"
         return response.text
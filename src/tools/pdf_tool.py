@@ -2,9 +2,12 @@
 
 from __future__ import annotations
 
+import asyncio
 import os
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from markdown import markdown
 
@@ -16,6 +19,69 @@ except Exception as exc:  # pragma: no cover
     WEASYPRINT_IMPORT_ERROR = exc
 
 from src.utils.file_utils import is_markdown_file, read_file_async
+from src.utils.process_pool import pool_context
+
+# WeasyPrint 렌더링은 CPU를 오래 쓰므로 이벤트 루프 밖의 상주 워커 프로세스에서 실행
+PDF_MAX_WORKERS = 2
+_PDF_POOL: Optional[ProcessPoolExecutor] = None
+# 워커 프로세스별 CSS 파싱 결과 캐시 ((경로, 수정 시각) → CSS)
+_STYLESHEET_CACHE: Dict[Tuple[str, float], "CSS"] = {}
+
+
+def _warm_weasyprint() -> None:
+    """워커 시작 시 작은 문서를 한 번 렌더링해 폰트/기본 CSS 로딩 비용을 미리 치릅니다."""
+    if WEASYPRINT_IMPORT_ERROR is None:
+        HTML(string="<p>warmup</p>").render()
+
+
+def _get_pdf_pool() -> ProcessPoolExecutor:
+    global _PDF_POOL
+    if _PDF_POOL is None:
+        _PDF_POOL = ProcessPoolExecutor(
+            max_workers=PDF_MAX_WORKERS, mp_context=pool_context(), initializer=_warm_weasyprint
+        )
+    return _PDF_POOL
+
+
+def _discard_pdf_pool(pool: ProcessPoolExecutor) -> None:
+    global _PDF_POOL
+    # 동시에 실패한 다른 호출이 이미 새 풀을 만들었으면 그대로 둠
+    if _PDF_POOL is pool:
+        _PDF_POOL = None
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+async def _run_in_pdf_pool(func: Callable[..., Any], *args: Any) -> Any:
+    """PDF 풀에서 func를 실행하고, 워커가 죽어 풀이 깨졌으면 새 풀로 한 번만 재시도합니다."""
+    loop = asyncio.get_running_loop()
+    pool = _get_pdf_pool()
+    try:
+        return await loop.run_in_executor(pool, func, *args)
+    except BrokenProcessPool:
+        _discard_pdf_pool(pool)
+        return await loop.run_in_executor(_get_pdf_pool(), func, *args)
+
+
+def shutdown_pdf_pool() -> None:
+    """상주 PDF 워커 프로세스를 종료합니다."""
+    global _PDF_POOL
+    if _PDF_POOL is not None:
+        _PDF_POOL.shutdown(wait=False, cancel_futures=True)
+        _PDF_POOL = None
+
+
+def _load_stylesheet(path: str) -> "CSS":
+    key = (path, os.path.getmtime(path))
+    stylesheet = _STYLESHEET_CACHE.get(key)
+    if stylesheet is None:
+        stylesheet = _STYLESHEET_CACHE[key] = CSS(filename=path)
+    return stylesheet
+
+
+def _write_pdf(html_payload: str, output_path: str, css_paths: Tuple[str, ...]) -> None:
+    # 워커 프로세스에서 실행 (인자는 모두 pickle 가능한 기본 타입)
+    stylesheets = [_load_stylesheet(path) for path in css_paths] or None
+    HTML(string=html_payload).write_pdf(output_path, stylesheets=stylesheets)
 
 
 class PDFService:
@@ -48,9 +114,12 @@ class PDFService:
 
         try:
             html_payload = await self._render_html(absolute_input)
-            html_doc = HTML(string=html_payload)
-            stylesheets = self._collect_stylesheets(css_path)
-            html_doc.write_pdf(str(absolute_output), stylesheets=stylesheets)
+            await _run_in_pdf_pool(
+                _write_pdf,
+                html_payload,
+                str(absolute_output),
+                self._collect_stylesheets(css_path)
+            )
             result.update({"success": True, "output_path": str(absolute_output)})
         except Exception as exc:  # pragma: no cover - conversion failure reporting
             result["error"] = str(exc)
@@ -90,15 +159,14 @@ class PDFService:
         </html>
         """
 
-    def _collect_stylesheets(self, css_path: Optional[str]) -> Optional[List[CSS]]:
-        if WEASYPRINT_IMPORT_ERROR is not None:  # pragma: no cover
-            return None
-        styles: List[CSS] = []
+    def _collect_stylesheets(self, css_path: Optional[str]) -> Tuple[str, ...]:
+        # 워커 프로세스로 넘길 수 있도록 CSS 객체 대신 존재하는 파일 경로만 모음
+        styles: List[str] = []
         css_candidates = [css_path, self.default_css]
         for candidate in css_candidates:
             if not candidate:
                 continue
             path = Path(candidate).expanduser()
             if path.exists():
-                styles.append(CSS(filename=str(path)))
-        return styles or None
+                styles.append(str(path.resolve()))
+        return tuple(styles)
@@ -0,0 +1,26 @@
+"""환경 변수로 재정의하는 설정값 파싱 헬퍼."""
+
+from __future__ import annotations
+
+import os
+from typing import Optional
+
+
+def env_int(name: str, default: int, minimum: Optional[int] = None) -> int:
+    """정수 환경 변수를 읽습니다 (비어 있거나 숫자가 아니면 default, minimum보다 작으면 minimum)."""
+    value = os.getenv(name)
+    try:
+        result = int(value) if value else default
+    except ValueError:
+        result = default
+    if minimum is not None and result < minimum:
+        return minimum
+    return result
+
+
+def env_bool(name: str, default: bool) -> bool:
+    """불리언 환경 변수를 읽습니다 (1/true/yes/on이면 True)."""
+    value = os.getenv(name)
+    if not value:
+        return default
+    return value.strip().lower() in {"1", "true", "yes", "on"}
@@ -0,0 +1,22 @@
+"""이벤트 루프 설정 유틸리티 (uvloop 사용 가능 시 우선 사용)."""
+
+from __future__ import annotations
+
+import asyncio
+import sys
+from typing import Any, Coroutine, TypeVar
+
+try:
+    import uvloop
+    UVLOOP_AVAILABLE = sys.platform != "win32"
+except ImportError:
+    UVLOOP_AVAILABLE = False
+
+T = TypeVar("T")
+
+
+def run(main: Coroutine[Any, Any, T]) -> T:
+    """asyncio.Runner로 코루틴을 실행합니다 (uvloop가 있으면 uvloop 루프 사용)."""
+    loop_factory = uvloop.new_event_loop if UVLOOP_AVAILABLE else None
+    with asyncio.Runner(loop_factory=loop_factory) as runner:
+        return runner.run(main)
@@ -1,8 +1,9 @@
 """File utility functions for async file operations."""
 
 import asyncio
+import os
 from pathlib import Path
-from typing import Iterable, List, Optional
+from typing import Iterable, Iterator, List, Optional
 
 
 async def read_file_async(file_path: str) -> str:
@@ -27,22 +28,41 @@ async def list_files_async(
     recursive: bool = True
 ) -> List[str]:
     """비동기적으로 디렉토리의 파일 목록을 가져옵니다."""
+    return await asyncio.to_thread(lambda: list(iter_files(directory, extensions, recursive)))
 
-    def _collect_files() -> List[str]:
-        files: List[str] = []
-        path = Path(directory)
 
-        if not path.exists():
-            return files
-
-        pattern = "**/*" if recursive else "*"
-        for file_path in path.glob(pattern):
-            if file_path.is_file():
-                if extensions is None or file_path.suffix in extensions:
-                    files.append(str(file_path))
-        return files
-
-    return await asyncio.to_thread(_collect_files)
+def iter_files(
+    directory: str,
+    extensions: Optional[Iterable[str]] = None,
+    recursive: bool = True
+) -> Iterator[str]:
+    """os.scandir로 디렉토리를 한 번만 순회하며 확장자가 일치하는 파일 경로를 반환합니다.
+
+    순서는 Path.glob("**/*")와 같고(디렉토리의 파일 → 하위 디렉토리 순),
+    심볼릭 링크 디렉토리는 따라가지 않습니다.
+    """
+    suffixes = None if extensions is None else frozenset(extensions)
+    pending = [str(Path(directory))]
+    while pending:
+        current = pending.pop()
+        try:
+            with os.scandir(current) as entries:
+                entry_list = list(entries)
+        except OSError:
+            continue
+        subdirs: List[str] = []
+        for entry in entry_list:
+            try:
+                if recursive and entry.is_dir() and not entry.is_symlink():
+                    subdirs.append(entry.path)
+                    continue
+                if suffixes is not None and os.path.splitext(entry.name)[1] not in suffixes:
+                    continue
+                if entry.is_file():
+                    yield entry.path
+            except OSError:
+                continue
+        pending.extend(reversed(subdirs))
 
 
 def get_file_extension(file_path: str) -> str:
@@ -0,0 +1,47 @@
+"""JSON 직렬화 유틸리티 (orjson 사용 가능 시 우선 사용)."""
+
+from __future__ import annotations
+
+import json
+import os
+from typing import Any
+
+# GARY_MCP_PRETTY=1 이면 디버깅용으로 들여쓰기된 응답을 생성
+PRETTY = os.getenv("GARY_MCP_PRETTY") == "1"
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+    # dumps_text용 옵션 (호출마다 비트 OR 하지 않도록 미리 계산)
+    _TEXT_OPTIONS = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if PRETTY else 0)
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+_STDLIB_TEXT_KWARGS: dict[str, Any] = (
+    {"indent": 2} if PRETTY else {"separators": (",", ":")}
+)
+
+
+def dumps_bytes(payload: Any) -> bytes:
+    """객체를 UTF-8 JSON 바이트로 직렬화합니다."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(payload)
+    return json.dumps(payload, ensure_ascii=False).encode("utf-8")
+
+
+def loads(data: bytes | bytearray | str) -> Any:
+    """JSON 바이트/문자열을 파싱합니다 (오류 시 json.JSONDecodeError)."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps_text(payload: Any) -> str:
+    """MCP 응답용 JSON 문자열을 만듭니다 (기본은 공백 없는 형태, PRETTY면 2칸 들여쓰기).
+
+    Decimal, datetime 등 JSON 기본 타입이 아닌 값은 str()로 변환합니다.
+    TextContent.text가 str만 받으므로 orjson이 만든 UTF-8 바이트를 한 번만 디코드합니다.
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(payload, default=str, option=_TEXT_OPTIONS).decode("utf-8")
+    return json.dumps(payload, ensure_ascii=False, default=str, **_STDLIB_TEXT_KWARGS)
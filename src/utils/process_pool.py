@@ -0,0 +1,17 @@
+"""워커 프로세스 풀 공통 설정."""
+
+from __future__ import annotations
+
+import multiprocessing
+from multiprocessing.context import BaseContext
+
+
+def pool_context() -> BaseContext:
+    """워커 프로세스 시작 방식 (forkserver, 지원하지 않는 플랫폼은 spawn).
+
+    이벤트 루프 스레드와 열린 소켓을 가진 서버 프로세스를 fork하면 락/핸들이 그대로 복제되어
+    워커가 멈출 수 있으므로 fork를 쓰지 않습니다.
+    """
+    if "forkserver" in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("forkserver")
+    return multiprocessing.get_context("spawn")
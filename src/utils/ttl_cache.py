@@ -0,0 +1,93 @@
+"""크기 제한(LRU)과 만료 시간(TTL)이 있는 메모리 캐시."""
+
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Hashable, List, Optional, Tuple
+
+# 캐시 미스를 None 값과 구분하기 위한 표식
+MISSING = object()
+
+
+class TTLCache:
+    """최근 사용 순으로 최대 maxsize개, 항목별 ttl초 동안 값을 보관합니다.
+
+    이벤트 루프 스레드에서만 사용하는 것을 전제로 하며 락을 두지 않습니다.
+    """
+
+    __slots__ = ("maxsize", "ttl", "on_evict", "_entries")
+
+    def __init__(
+        self,
+        maxsize: int = 256,
+        ttl: float = 60.0,
+        on_evict: Optional[Callable[[Any], None]] = None
+    ) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        # 만료/용량 초과로 버려지는 값을 정리할 콜백 (pop/clear로 꺼낸 값은 호출한 쪽이 정리)
+        self.on_evict = on_evict
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+
+    def get(self, key: Hashable, default: Any = MISSING) -> Any:
+        """유효한 캐시 값을 반환합니다 (없거나 만료되면 default)."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return default
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            if self.on_evict is not None:
+                self.on_evict(value)
+            return default
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        self._entries[key] = (time.monotonic() + self.ttl, value)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.maxsize:
+            _, (_, evicted) = self._entries.popitem(last=False)
+            if self.on_evict is not None:
+                self.on_evict(evicted)
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        entry = self._entries.pop(key, None)
+        return default if entry is None else entry[1]
+
+    def values(self) -> List[Any]:
+        """보관 중인 값 목록 (만료됐지만 아직 정리되지 않은 항목 포함)."""
+        return [value for _, value in self._entries.values()]
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+
+async def cached_call(
+    cache: TTLCache,
+    func: Callable[..., Any],
+    *args: Any,
+    runner: Optional[Callable[..., Awaitable[Any]]] = None
+) -> Any:
+    """(func, *args)를 키로 캐시된 결과를 반환하고, 없으면 실행해 성공한 결과만 캐시합니다.
+
+    runner가 있으면 runner(func, *args)로 실행합니다 (동기 함수를 스레드 풀에서 실행할 때).
+    success가 False인 결과(인증 만료, 네트워크 오류 등)는 캐시하지 않아 다음 호출에서 다시 시도합니다.
+    """
+    key = (func, *args)
+    try:
+        cached = cache.get(key)
+    except TypeError:  # 해시할 수 없는 인자는 캐시하지 않음
+        return await (runner(func, *args) if runner is not None else func(*args))
+    if cached is not MISSING:
+        return cached
+    result = await (runner(func, *args) if runner is not None else func(*args))
+    # success 키가 없는 결과(문서 목록 등)는 성공으로 취급
+    if result.get("success", True):
+        cache.set(key, result)
+    return result
@@ -0,0 +1,45 @@
+"""document_tool 청크 단위 검색 테스트."""
+
+import random
+
+import pytest
+
+from src.tools import document_tool
+from src.tools.document_tool import _has_border, _scan_file
+
+QUERIES = ["a", "ab", "aa", "aaa", "aba", "abab", "abcab", "b", "xyz", ""]
+
+
+@pytest.mark.parametrize(
+    ("query", "expected"),
+    [("", False), ("a", False), ("ab", False), ("aa", True), ("aba", True), ("abab", True), ("abcab", True), ("abc", False)],
+)
+def test_has_border(query: str, expected: bool) -> None:
+    assert _has_border(query) is expected
+
+
+@pytest.mark.parametrize("chunk_chars", [1, 2, 3, 5, 7, 64])
+def test_scan_file_matches_str_count(tmp_path, monkeypatch, chunk_chars: int) -> None:
+    # 청크를 작게 잡아 검색어가 청크 경계에 걸치는 경우를 많이 만듦
+    monkeypatch.setattr(document_tool, "SEARCH_CHUNK_CHARS", chunk_chars)
+    rng = random.Random(chunk_chars)
+    file_path = tmp_path / "doc.md"
+    for _ in range(50):
+        text = "".join(rng.choice("aAbBc") for _ in range(rng.randint(0, 60)))
+        file_path.write_text(text, encoding="utf-8")
+        for query in QUERIES:
+            expected = text.lower().count(query)
+            result = _scan_file(str(file_path), query)
+            if expected:
+                assert result is not None, (text, query)
+                assert result[0] == expected, (text, query)
+            else:
+                assert result is None, (text, query)
+
+
+def test_scan_file_preview(tmp_path, monkeypatch) -> None:
+    monkeypatch.setattr(document_tool, "SEARCH_CHUNK_CHARS", 7)
+    file_path = tmp_path / "doc.md"
+    text = "ab" * 150
+    file_path.write_text(text, encoding="utf-8")
+    assert _scan_file(str(file_path), "abab") == (75, text[:document_tool.PREVIEW_CHARS] + "...")